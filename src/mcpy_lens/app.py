@@ -4,7 +4,7 @@ import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from mcpy_lens.config import get_settings
@@ -14,7 +14,7 @@ from mcpy_lens.adapter.routes import adapter_router, cleanup_adapter_service
 from mcpy_lens.service_registry.routes import service_registry_router, cleanup_service_manager, set_service_manager
 from mcpy_lens.service_registry.service_manager import ServiceManager
 from mcpy_lens.logging_config import setup_logging
-from mcpy_lens.models import HealthCheckResponse
+from mcpy_lens.models import HealthCheckResponse, healthy_bytes
 from mcpy_lens.routing import RouteManager
 
 # ——— Application startup and shutdown ———
@@ -121,11 +121,15 @@ def setup_routes(app: FastAPI) -> None:
     """Setup core application routes."""
 
     @app.get("/health", response_model=HealthCheckResponse)
-    async def health_check() -> HealthCheckResponse:
-        """Health check endpoint."""
-        return HealthCheckResponse(
-            status="healthy", version="0.1.0", message="mcpy-lens service is running"
-        )    # Include file management routes
+    async def health_check() -> Response:
+        """Health check endpoint.
+
+        Returns pre-serialized bytes instead of building a Pydantic model;
+        the response_model is kept for the OpenAPI schema only.
+        """
+        return Response(content=healthy_bytes("0.1.0"), media_type="application/json")
+
+    # Include file management routes
     app.include_router(file_router)
 
     # Include adapter routes
@@ -3,11 +3,19 @@
 import logging
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request, Response, status
 
 from mcpy_lens.models import ErrorResponse
 
+
+def _error_response(err: ErrorResponse, status_code: int) -> Response:
+    """Build a JSON response from pre-serialized error bytes."""
+    return Response(
+        content=err.to_json_bytes(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
 # ——— Custom exceptions ———
 
 
@@ -49,7 +57,7 @@ class DynamicRoutingError(McpyLensException):
 
 async def mcpy_lens_exception_handler(
     request: Request, exc: McpyLensException
-) -> JSONResponse:
+) -> Response:
     """Handle custom mcpy-lens exceptions."""
     logging.error(
         "McpyLens exception occurred",
@@ -62,17 +70,17 @@ async def mcpy_lens_exception_handler(
         },
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content=ErrorResponse(
+    return _error_response(
+        ErrorResponse(
             error=exc.__class__.__name__,
             message=exc.message,
             details=exc.details,
-        ).model_dump(),
+        ),
+        status.HTTP_400_BAD_REQUEST,
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
     """Handle HTTP exceptions."""
     logging.warning(
         "HTTP exception occurred",
@@ -84,16 +92,16 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         },
     )
 
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=ErrorResponse(
+    return _error_response(
+        ErrorResponse(
             error="HTTPException",
             message=str(exc.detail),
-        ).model_dump(),
+        ),
+        exc.status_code,
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle general exceptions."""
     logging.exception(
         "Unhandled exception occurred",
@@ -104,12 +112,12 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         },
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ErrorResponse(
+    return _error_response(
+        ErrorResponse(
             error="InternalServerError",
             message="An internal server error occurred",
-        ).model_dump(),
+        ),
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
     )
 
 
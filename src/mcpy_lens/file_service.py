@@ -25,6 +25,7 @@ from mcpy_lens.discovery import (
     create_tool_metadata_file
 )
 from mcpy_lens.models import (
+    SCRIPT_LIST,
     CLIWrapperRequest,
     CLIWrapperResponse,
     FunctionInfo,
@@ -127,8 +128,10 @@ class FileService:
             try:
                 with open(metadata_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    for script_id, metadata_dict in data.items():
-                        self._scripts_metadata[script_id] = ScriptMetadata(**metadata_dict)
+                    # One pass through the precompiled list validator
+                    # instead of a model build per script
+                    validated = SCRIPT_LIST.validate_python(list(data.values()))
+                    self._scripts_metadata = dict(zip(data.keys(), validated))
                 logger.info(f"Loaded metadata for {len(self._scripts_metadata)} scripts")
             except Exception as e:
                 logger.error(f"Failed to load scripts metadata: {e}")
@@ -450,10 +453,8 @@ class FileService:
         # Apply pagination
         paginated_scripts = scripts[offset:offset + limit]
         
-        return ScriptListResponse(
-            scripts=paginated_scripts,
-            total=len(scripts)
-        )
+        # Metadata was validated on load; skip Pydantic re-validation
+        return ScriptListResponse.from_trusted(paginated_scripts, total=len(scripts))
     
     async def get_script_content(self, script_id: str) -> bytes:
         """Get the content of a script file."""
@@ -546,10 +547,7 @@ class FileService:
         # Sort by upload time (newest first)
         matching_scripts.sort(key=lambda x: x.upload_time, reverse=True)
         
-        return ScriptListResponse(
-            scripts=matching_scripts,
-            total=len(matching_scripts)
-        )
+        return ScriptListResponse.from_trusted(matching_scripts)
     
     def _setup_file_monitoring(self) -> None:
         """Set up file system monitoring for uploaded scripts directory."""
@@ -1,6 +1,9 @@
 """HTTP client for communicating with the FastAPI backend."""
 
+import asyncio
+import atexit
 import logging
+import time
 from typing import Any, Dict, List, Optional, Union
 import httpx
 import json
@@ -18,17 +21,45 @@ class APIClient:
             base_url: Base URL of the FastAPI backend
         """
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.Client(base_url=self.base_url, timeout=30.0)
-    
+        # The sync client mirrors the async one: keep-alive pooling means a
+        # health probe or CRUD call reuses an open connection instead of
+        # paying a TCP handshake per request.
+        self.client = httpx.Client(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0,
+            ),
+        )
+        # One pooled async client shared by every handler: keep-alive
+        # connections avoid per-call TCP handshakes and HTTP/2 multiplexes
+        # concurrent gathers over a single socket. The tight timeout bounds
+        # worst-case handler latency when the backend hangs; the error is
+        # caught per-method and surfaced as an error payload.
+        self.async_client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
     def __enter__(self):
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.client.close()
-    
+
     def close(self):
         """Close the HTTP client."""
         self.client.close()
+
+    async def aclose(self):
+        """Close both the sync and async HTTP clients."""
+        self.client.close()
+        await self.async_client.aclose()
     
     # ——— Health and Status ———
     
@@ -216,10 +247,10 @@ class APIClient:
     
     def get_service_health(self, service_id: str) -> Dict[str, Any]:
         """Get service health status.
-        
+
         Args:
             service_id: Unique service identifier
-            
+
         Returns:
             Service health information
         """
@@ -231,6 +262,98 @@ class APIClient:
             logger.error(f"Failed to get service health for {service_id}: {e}")
             return {"status": "error", "error": str(e)}
 
+    # ——— Async variants (used by Gradio event handlers) ———
+
+    async def ahealth_check(self) -> Dict[str, Any]:
+        """Check the health of the FastAPI backend (async)."""
+        try:
+            response = await self.async_client.get("/health")
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+            return {"status": "error", "message": str(e)}
+
+    async def alist_services(self) -> Dict[str, Any]:
+        """List all registered services (async)."""
+        try:
+            response = await self.async_client.get("/api/v1/services")
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logger.error(f"Failed to list services: {e}")
+            return {"services": [], "error": str(e)}
+
+    async def aget_service(self, service_id: str) -> Dict[str, Any]:
+        """Get service details by ID (async).
+
+        Args:
+            service_id: Unique service identifier
+
+        Returns:
+            Service details
+        """
+        try:
+            response = await self.async_client.get(f"/api/v1/services/{service_id}")
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logger.error(f"Failed to get service {service_id}: {e}")
+            return {"error": str(e)}
+
+    async def adelete_service(self, service_id: str) -> Dict[str, Any]:
+        """Delete a service (async).
+
+        Args:
+            service_id: Unique service identifier
+
+        Returns:
+            Deletion result
+        """
+        try:
+            response = await self.async_client.delete(f"/api/v1/services/{service_id}")
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logger.error(f"Failed to delete service {service_id}: {e}")
+            return {"error": str(e)}
+
+    async def abatch_get_health(self, service_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch health for many services in one round of concurrent calls.
+
+        Interim implementation until the backend grows a batch health
+        endpoint; the per-service requests share the pooled async client.
+
+        Args:
+            service_ids: Service identifiers to check
+
+        Returns:
+            Mapping of service_id to health information
+        """
+        if not service_ids:
+            return {}
+        results = await asyncio.gather(
+            *(self.aget_service_health(service_id) for service_id in service_ids)
+        )
+        return dict(zip(service_ids, results))
+
+    async def aget_service_health(self, service_id: str) -> Dict[str, Any]:
+        """Get service health status (async).
+
+        Args:
+            service_id: Unique service identifier
+
+        Returns:
+            Service health information
+        """
+        try:
+            response = await self.async_client.get(f"/api/v1/services/{service_id}/health")
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logger.error(f"Failed to get service health for {service_id}: {e}")
+            return {"status": "error", "error": str(e)}
+
 
 # Global API client instance
 _api_client: Optional[APIClient] = None
@@ -249,4 +372,48 @@ def close_api_client():
     global _api_client
     if _api_client is not None:
         _api_client.close()
+        try:
+            asyncio.run(_api_client.async_client.aclose())
+        except RuntimeError:
+            # An event loop is still running; the pooled connections are
+            # torn down with the process instead.
+            pass
         _api_client = None
+
+
+atexit.register(close_api_client)
+
+
+# Short-TTL cache for service listings, shared by the interface modules so
+# back-to-back handler returns (refresh + action buttons) reuse one fetch.
+_services_cache: Dict[str, Any] = {"ts": 0.0, "data": None}
+_services_cache_lock = asyncio.Lock()
+
+
+async def cached_list_services(max_age: float = 3.0) -> Dict[str, Any]:
+    """List services, reusing a recent result when one is available.
+
+    Args:
+        max_age: Maximum age in seconds before the cache is refreshed
+
+    Returns:
+        Service listing response
+    """
+    async with _services_cache_lock:
+        now = time.monotonic()
+        if (
+            _services_cache["data"] is not None
+            and now - _services_cache["ts"] < max_age
+        ):
+            return _services_cache["data"]
+
+        result = await get_api_client().alist_services()
+        if "error" not in result:
+            _services_cache["ts"] = now
+            _services_cache["data"] = result
+        return result
+
+
+def invalidate_services_cache() -> None:
+    """Force the next cached_list_services() call to refetch."""
+    _services_cache["ts"] = 0.0
@@ -1,10 +1,15 @@
 """Common Gradio components and utilities."""
 
+import asyncio
+import functools
+import time
 import gradio as gr
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import json
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,12 +74,16 @@ def format_json_display(data: Dict[str, Any]) -> str:
         return str(data)
 
 
+@functools.lru_cache(maxsize=256)
 def create_status_badge(status: str) -> str:
     """Create a status badge for display.
-    
+
+    Memoized: the input domain is a handful of status strings and the
+    badge is rebuilt once per table row otherwise.
+
     Args:
         status: Status string
-        
+
     Returns:
         Formatted status badge
     """
@@ -131,23 +140,104 @@ def create_empty_state_message(entity: str) -> str:
 
 def validate_json_input(json_str: str) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
     """Validate JSON input string.
-    
+
+    Callers must treat the returned payload as read-only: cache hits
+    hand back the same parsed object, so mutating it would poison the
+    result of the next validation of identical text.
+
     Args:
         json_str: JSON string to validate
-        
+
     Returns:
         Tuple of (is_valid, parsed_data, error_message)
     """
     if not json_str.strip():
         return False, None, "JSON input is empty"
-    
+
+    # Preview and create both validate the same text within one user
+    # action, so a one-slot cache skips the duplicate parse. Keyed on
+    # the string itself — string equality is cheap after a length check,
+    # and hashing alone could collide two different inputs.
+    cached = validate_json_input._last_parse
+    if cached is not None and cached[0] == json_str:
+        return True, cached[1], None
+
     try:
-        data = json.loads(json_str)
+        data = orjson.loads(json_str)
+        validate_json_input._last_parse = (json_str, data)
         return True, data, None
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         return False, None, f"Invalid JSON: {str(e)}"
 
 
+validate_json_input._last_parse = None
+
+
+def debounce(delay: float) -> Callable:
+    """Debounce an async event handler.
+
+    Collapses rapid successive events (e.g. per-keystroke change events)
+    into a single trailing call: each invocation waits ``delay`` seconds
+    and only runs the wrapped handler if no newer invocation arrived in
+    the meantime. Superseded invocations return ``gr.skip()`` so Gradio
+    leaves the outputs untouched.
+
+    Args:
+        delay: Settle time in seconds before the handler runs
+
+    Returns:
+        Decorator for an async handler function
+    """
+    def decorator(fn: Callable) -> Callable:
+        generation = 0
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            nonlocal generation
+            generation += 1
+            my_generation = generation
+            await asyncio.sleep(delay)
+            if my_generation != generation:
+                return gr.skip()
+            return await fn(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+
+def throttle(interval: float) -> Callable:
+    """Throttle an async event handler.
+
+    Caps execution at one run per ``interval`` seconds: invocations that
+    land inside the window return the previous result without touching
+    the backend. Complements ``debounce`` — the throttle caps burst
+    frequency (e.g. refresh-button spam), the debounce waits for input
+    to settle.
+
+    Args:
+        interval: Minimum seconds between handler runs
+
+    Returns:
+        Decorator for an async handler function
+    """
+    def decorator(fn: Callable) -> Callable:
+        last_ts = 0.0
+        last_result = None
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            nonlocal last_ts, last_result
+            now = time.monotonic()
+            if last_result is not None and now - last_ts < interval:
+                return last_result
+            last_result = await fn(*args, **kwargs)
+            last_ts = time.monotonic()
+            return last_result
+
+        return wrapper
+    return decorator
+
+
 def create_refresh_button(label: str = "🔄 Refresh") -> gr.Button:
     """Create a refresh button with consistent styling.
     
@@ -203,12 +293,15 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} {size_names[i]}"
 
 
+@functools.lru_cache(maxsize=256)
 def format_timestamp(timestamp: str) -> str:
     """Format timestamp for display.
-    
+
+    Memoized: repeat timestamps across refreshes skip the ISO-8601 parse.
+
     Args:
         timestamp: ISO timestamp string
-        
+
     Returns:
         Formatted timestamp
     """
@@ -1,6 +1,7 @@
 """File management interface for uploading and managing Python scripts."""
 
 import gradio as gr
+import operator
 import pandas as pd
 from typing import Any, Dict, List, Optional, Tuple
 import logging
@@ -50,9 +51,14 @@ def create_file_management_interface() -> gr.Tab:
                     lines=15
                 )
         
-        # Script metadata section
+        # Script metadata section. The raw result is parked in a gr.State and
+        # only serialized into the visible JSON component while the accordion
+        # is open, so large metadata payloads are not shipped on every action.
         gr.Markdown("### Script Metadata")
-        metadata_display = gr.JSON(label="Script Information")
+        metadata_state = gr.State({})
+        metadata_accordion_open = gr.State(False)
+        with gr.Accordion("Script Information", open=False) as metadata_accordion:
+            metadata_display = gr.JSON(label="Script Information")
 
         # Function discovery section
         gr.Markdown("### Discovered Functions")
@@ -127,19 +133,38 @@ def create_file_management_interface() -> gr.Tab:
                 if not scripts:
                     return pd.DataFrame(columns=["ID", "Filename", "Status", "Functions", "Size", "Upload Date", "Actions"])
                 
-                # Format data for table
+                # Format data for table; bind formatters to locals and batch
+                # the dict extraction so the per-row loop stays cheap for
+                # large script lists.
+                _get = operator.itemgetter(
+                    "script_id", "filename", "status", "functions",
+                    "file_size", "created_at"
+                )
+                _badge = create_status_badge
+                _size = format_file_size
+                _ts = format_timestamp
+
                 table_data = []
+                _append = table_data.append
                 for script in scripts:
-                    functions = script.get("functions", [])
-                    function_count = len(functions) if functions else 0
+                    try:
+                        script_id, filename, status, functions, file_size, created_at = _get(script)
+                    except KeyError:
+                        script_id = script.get("script_id", "")
+                        filename = script.get("filename", "Unknown")
+                        status = script.get("status", "unknown")
+                        functions = script.get("functions", [])
+                        file_size = script.get("file_size", 0)
+                        created_at = script.get("created_at", "")
 
-                    table_data.append([
-                        script.get("script_id", ""),  # Full ID for selection
-                        script.get("filename", "Unknown"),
-                        create_status_badge(script.get("status", "unknown")),
+                    function_count = len(functions) if functions else 0
+                    _append([
+                        script_id,  # Full ID for selection
+                        filename,
+                        _badge(status),
                         f"{function_count} functions",
-                        format_file_size(script.get("file_size", 0)),
-                        format_timestamp(script.get("created_at", "")),
+                        _size(file_size),
+                        _ts(created_at),
                         "View | Delete"
                     ])
                 
@@ -170,23 +195,28 @@ def create_file_management_interface() -> gr.Tab:
                 logger.error(f"Error viewing script: {e}")
                 return f"❌ Error: {str(e)}", {}
         
-        def handle_delete_script(script_id: str) -> Tuple[str, pd.DataFrame]:
-            """Handle script deletion."""
+        def handle_delete_script(script_id: str) -> Tuple[str, Any]:
+            """Handle script deletion.
+
+            Only the success path refreshes the table; error paths return
+            gr.update() so Gradio leaves the unchanged table alone instead
+            of triggering a full list fetch and DataFrame rebuild.
+            """
             if not script_id.strip():
-                return "❌ Please enter a script ID", load_scripts_list()
+                return "❌ Please enter a script ID", gr.update()
 
             try:
                 api_client = get_api_client()
                 result = api_client.delete_script(script_id)
 
                 if "error" in result:
-                    return f"❌ Failed to delete script: {result['error']}", load_scripts_list()
+                    return f"❌ Failed to delete script: {result['error']}", gr.update()
 
                 return f"✅ Script {script_id} deleted successfully", load_scripts_list()
 
             except Exception as e:
                 logger.error(f"Error deleting script: {e}")
-                return f"❌ Error: {str(e)}", load_scripts_list()
+                return f"❌ Error: {str(e)}", gr.update()
 
         def handle_discover_functions(script_id: str) -> Dict[str, Any]:
             """Handle function discovery for a script."""
@@ -226,6 +256,24 @@ def create_file_management_interface() -> gr.Tab:
                 logger.error(f"Error discovering functions: {e}")
                 return {"error": f"Error: {str(e)}"}
 
+        def show_metadata(metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+            """Materialize stored metadata when the accordion is opened."""
+            return metadata or {}, True
+
+        def hide_metadata() -> bool:
+            """Record that the accordion closed so updates stay deferred."""
+            return False
+
+        def refresh_metadata(metadata: Dict[str, Any], is_open: bool) -> Any:
+            """Refresh the display on state changes, but only while open.
+
+            While the accordion is closed the payload stays parked in the
+            state and the expand handler ships it on first open.
+            """
+            if not is_open:
+                return gr.skip()
+            return metadata or {}
+
         def handle_table_select(evt: gr.SelectData) -> str:
             """Handle table row selection."""
             if evt.index is not None and len(evt.index) >= 2:
@@ -237,7 +285,7 @@ def create_file_management_interface() -> gr.Tab:
         upload_btn.click(
             fn=handle_file_upload,
             inputs=[file_upload],
-            outputs=[upload_status, file_preview, metadata_display]
+            outputs=[upload_status, file_preview, metadata_state]
         )
         
         refresh_btn.click(
@@ -248,7 +296,29 @@ def create_file_management_interface() -> gr.Tab:
         view_btn.click(
             fn=handle_view_script,
             inputs=[selected_script_id],
-            outputs=[action_status, metadata_display]
+            outputs=[action_status, metadata_state]
+        )
+
+        metadata_accordion.expand(
+            fn=show_metadata,
+            inputs=[metadata_state],
+            outputs=[metadata_display, metadata_accordion_open]
+        )
+
+        metadata_accordion.collapse(
+            fn=hide_metadata,
+            outputs=[metadata_accordion_open]
+        )
+
+        # Keep an already-open accordion in sync: without this, viewing a
+        # different script only updates the state and the display keeps
+        # showing the previous script until the accordion is reopened.
+        # Gated on the open flag so closed accordions still defer the
+        # payload to the expand handler instead of shipping it per action.
+        metadata_state.change(
+            fn=refresh_metadata,
+            inputs=[metadata_state, metadata_accordion_open],
+            outputs=[metadata_display]
         )
         
         delete_btn.click(
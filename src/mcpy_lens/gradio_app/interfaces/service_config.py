@@ -1,6 +1,7 @@
 """Service configuration interface for creating and configuring MCP services."""
 
 import gradio as gr
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Tuple
 import logging
 import json
@@ -15,6 +16,24 @@ from ..components.common import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _ServiceConfigDraft:
+    """Single construction site for the preview and create payloads."""
+
+    script_id: str
+    name: str
+    description: str
+    type: str
+    hosting_mode: str
+    status: str = "active"
+    selected_functions: Optional[List[str]] = None
+    parameters: Optional[Dict[str, Any]] = None
+
+    def to_config(self) -> Dict[str, Any]:
+        """Return the service configuration dict, dropping unset fields."""
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
 def create_service_config_interface() -> gr.Tab:
     """Create the service configuration interface tab.
     
@@ -29,35 +48,12 @@ def create_service_config_interface() -> gr.Tab:
         with gr.Group():
             gr.Markdown("### Step 1: Select Script")
             with gr.Row():
-                # Load scripts automatically on initialization
-                def load_initial_scripts():
-                    """Load scripts on page initialization."""
-                    try:
-                        api_client = get_api_client()
-                        result = api_client.list_scripts(limit=100)
-
-                        if "error" in result:
-                            logger.error(f"Failed to load initial scripts: {result['error']}")
-                            return []
-
-                        scripts = result.get("scripts", [])
-                        choices = []
-                        for script in scripts:
-                            script_id = script.get("script_id", "")
-                            filename = script.get("filename", "Unknown")
-                            choices.append((f"{filename} ({script_id[:8]}...)", script_id))
-
-                        logger.info(f"Loaded {len(choices)} scripts on initialization")
-                        return choices
-                    except Exception as e:
-                        logger.error(f"Error loading initial scripts: {e}")
-                        return []
-
-                initial_choices = load_initial_scripts()
-
+                # The dropdown starts empty; the script list is fetched
+                # asynchronously when the tab is first opened so building
+                # the app never blocks on the backend.
                 script_dropdown = gr.Dropdown(
                     label="Select Script",
-                    choices=initial_choices,
+                    choices=[],
                     interactive=True,
                     allow_custom_value=False
                 )
@@ -145,10 +141,10 @@ def create_service_config_interface() -> gr.Tab:
         # Event handlers
 
         
-        def handle_script_selection(script_id: str) -> Tuple[Dict[str, Any], gr.CheckboxGroup, Dict[str, Any]]:
+        def handle_script_selection(script_id: str) -> Tuple[Dict[str, Any], Any, Dict[str, Any]]:
             """Handle script selection and load script details."""
             if not script_id:
-                return {}, gr.CheckboxGroup(choices=[], value=[]), {}
+                return {}, gr.update(choices=[], value=[]), {}
 
             try:
                 api_client = get_api_client()
@@ -156,47 +152,36 @@ def create_service_config_interface() -> gr.Tab:
                 # Get script details
                 script_result = api_client.get_script(script_id)
                 if "error" in script_result:
-                    return {"error": script_result["error"]}, gr.CheckboxGroup(choices=[], value=[]), {}
+                    return {"error": script_result["error"]}, gr.update(choices=[], value=[]), {}
 
                 # Get tool discovery results
                 tools_result = api_client.discover_tools(script_id)
 
                 if "error" in tools_result:
-                    return script_result, gr.CheckboxGroup(choices=[], value=[]), {}
+                    return script_result, gr.update(choices=[], value=[]), {}
 
-                # Extract function information
+                # Extract function information in a single pass
                 functions = tools_result.get("tools", [])
 
-                function_choices = []
-                function_details = {}
-
-                for func in functions:
-                    func_name = func.get("name", "")
-                    func_doc = func.get("description", "No description")
-                    function_choices.append(func_name)
-                    function_details[func_name] = func
+                function_details = {func.get("name", ""): func for func in functions}
+                function_choices = list(function_details.keys())
 
                 return (
                     script_result,
-                    gr.CheckboxGroup(
-                        label="Available Functions",
-                        choices=function_choices,
-                        value=[],
-                        interactive=True
-                    ),
+                    gr.update(choices=function_choices, value=[]),
                     function_details
                 )
 
             except Exception as e:
                 logger.error(f"Error handling script selection: {e}")
-                return {"error": str(e)}, gr.CheckboxGroup(choices=[], value=[]), {}
-        
-        def handle_hosting_mode_change(mode: str) -> Tuple[gr.Group, gr.Group]:
+                return {"error": str(e)}, gr.update(choices=[], value=[]), {}
+
+        def handle_hosting_mode_change(mode: str) -> Tuple[Any, Any]:
             """Handle hosting mode change to show/hide relevant sections."""
             if mode == "function":
-                return gr.Group(visible=True), gr.Group(visible=False)
+                return gr.update(visible=True), gr.update(visible=False)
             else:
-                return gr.Group(visible=False), gr.Group(visible=True)
+                return gr.update(visible=False), gr.update(visible=True)
         
         def validate_parameters(params_json: str) -> str:
             """Validate parameter configuration JSON."""
@@ -217,25 +202,23 @@ def create_service_config_interface() -> gr.Tab:
             parameters_json: str
         ) -> Dict[str, Any]:
             """Preview the service configuration."""
-            config = {
-                "script_id": script_id,
-                "name": service_name,
-                "description": service_description,
-                "type": hosting_mode,
-                "hosting_mode": protocol,
-                "status": "active"
-            }
-            
+            draft = _ServiceConfigDraft(
+                script_id, service_name, service_description,
+                hosting_mode, protocol
+            )
+
             if hosting_mode == "function" and selected_functions:
-                config["selected_functions"] = selected_functions
+                draft.selected_functions = selected_functions
             elif hosting_mode == "executable":
                 is_valid, params_data, error = validate_json_input(parameters_json)
                 if is_valid:
-                    config["parameters"] = params_data
+                    draft.parameters = params_data
                 else:
+                    config = draft.to_config()
                     config["parameters_error"] = error
-            
-            return config
+                    return config
+
+            return draft.to_config()
         
         def create_service(
             script_id: str, service_name: str, service_description: str,
@@ -248,28 +231,24 @@ def create_service_config_interface() -> gr.Tab:
             
             try:
                 # Build service configuration
-                config = {
-                    "script_id": script_id,
-                    "name": service_name,
-                    "description": service_description,
-                    "type": hosting_mode,
-                    "hosting_mode": protocol,
-                    "status": "active"
-                }
-                
+                draft = _ServiceConfigDraft(
+                    script_id, service_name, service_description,
+                    hosting_mode, protocol
+                )
+
                 if hosting_mode == "function":
                     if not selected_functions:
                         return "❌ Please select at least one function for function mode"
-                    config["selected_functions"] = selected_functions
+                    draft.selected_functions = selected_functions
                 elif hosting_mode == "executable":
                     is_valid, params_data, error = validate_json_input(parameters_json)
                     if not is_valid:
                         return f"❌ Invalid parameters JSON: {error}"
-                    config["parameters"] = params_data
-                
+                    draft.parameters = params_data
+
                 # Create service via API
                 api_client = get_api_client()
-                result = api_client.create_service(config)
+                result = api_client.create_service(draft.to_config())
                 
                 if "error" in result:
                     return f"❌ Failed to create service: {result['error']}"
@@ -328,6 +307,12 @@ def create_service_config_interface() -> gr.Tab:
             fn=update_script_dropdown,
             outputs=[script_dropdown]
         )
+
+        # Populate the dropdown lazily when the tab is opened
+        tab.select(
+            fn=update_script_dropdown,
+            outputs=[script_dropdown]
+        )
         
         script_dropdown.change(
             fn=handle_script_selection,
@@ -1,20 +1,29 @@
 """Service management interface for monitoring and controlling MCP services."""
 
+import asyncio
 import gradio as gr
 import pandas as pd
 from typing import Any, Dict, List, Optional, Tuple
 import logging
 import time
 
-from ..api_client import get_api_client
+from ..api_client import cached_list_services, get_api_client, invalidate_services_cache
 from ..components.common import (
     create_error_display, create_success_display, create_info_display,
     format_json_display, create_status_badge, create_refresh_button,
-    create_action_button, format_timestamp, create_empty_state_message
+    create_action_button, format_timestamp, create_empty_state_message,
+    debounce, throttle
 )
 
 logger = logging.getLogger(__name__)
 
+_SERVICE_HEADERS = ("ID", "Name", "Type", "Status", "Health", "Tools", "Created", "Actions")
+_EMPTY_SERVICES_DF = pd.DataFrame(columns=_SERVICE_HEADERS)
+
+# Server-side page size for the services table; keeps render cost and
+# websocket payload constant regardless of how many services exist.
+_PAGE_SIZE = 50
+
 
 def create_service_management_interface() -> gr.Tab:
     """Create the service management interface tab.
@@ -23,6 +32,9 @@ def create_service_management_interface() -> gr.Tab:
         Gradio Tab component with service management interface
     """
     with gr.Tab("🎛️ Service Management") as tab:
+        # Capture the client singleton once; handlers close over it instead
+        # of re-resolving it on every invocation.
+        api_client = get_api_client()
         gr.Markdown("## Service Management Dashboard")
         gr.Markdown("Monitor and control your MCP services in real-time.")
         
@@ -33,11 +45,16 @@ def create_service_management_interface() -> gr.Tab:
         
         # Services table
         services_table = gr.DataFrame(
-            headers=["ID", "Name", "Type", "Status", "Health", "Tools", "Created", "Actions"],
+            headers=list(_SERVICE_HEADERS),
             datatype=["str", "str", "str", "str", "str", "str", "str", "str"],
-            interactive=False,
-            wrap=True
+            interactive=False
         )
+
+        # Pagination controls
+        page_state = gr.State(0)
+        with gr.Row():
+            prev_page_btn = gr.Button("⬅️ Previous", variant="secondary", size="sm")
+            next_page_btn = gr.Button("➡️ Next", variant="secondary", size="sm")
         
         # Service actions
         with gr.Row():
@@ -77,121 +94,182 @@ def create_service_management_interface() -> gr.Tab:
                 placeholder="Service logs will appear here..."
             )
         
-        # Event handlers
-        def load_services_list() -> pd.DataFrame:
-            """Load and format services list."""
+        # Event handlers run as coroutines on Gradio's event loop instead of
+        # dedicated worker threads; all backend I/O goes through the async
+        # client methods.
+        async def load_services_list(page: int = 0) -> pd.DataFrame:
+            """Load and format one page of the services list."""
             try:
-                api_client = get_api_client()
-                result = api_client.list_services()
+                result = await cached_list_services()
                 
                 if "error" in result:
                     logger.error(f"Failed to load services: {result['error']}")
-                    return pd.DataFrame(columns=["ID", "Name", "Type", "Status", "Health", "Tools", "Created", "Actions"])
-                
+                    return _EMPTY_SERVICES_DF.copy()
+
                 services = result.get("services", [])
+                services = services[page * _PAGE_SIZE:(page + 1) * _PAGE_SIZE]
                 if not services:
-                    return pd.DataFrame(columns=["ID", "Name", "Type", "Status", "Health", "Tools", "Created", "Actions"])
-                
-                # Format data for table
-                table_data = []
-                for service in services:
-                    tools = service.get("tools", [])
-                    tool_count = len(tools) if tools else 0
-                    
-                    table_data.append([
-                        service.get("service_id", "")[:8] + "...",  # Shortened ID
-                        service.get("name", "Unknown"),
-                        service.get("type", "unknown").title(),
-                        create_status_badge(service.get("status", "unknown")),
-                        create_status_badge("healthy"),  # Placeholder
-                        f"{tool_count} tools",
-                        format_timestamp(service.get("created_at", "")),
-                        "Start | Stop | Delete"
-                    ])
-                
-                return pd.DataFrame(
-                    table_data,
-                    columns=["ID", "Name", "Type", "Status", "Health", "Tools", "Created", "Actions"]
-                )
-                
+                    return _EMPTY_SERVICES_DF.copy()
+
+                # One batched round of health checks instead of a per-row
+                # fetch (N+1); the column falls back to "unknown" for
+                # services whose check failed.
+                ids = [s.get("service_id", "") for s in services]
+                health_map = await api_client.abatch_get_health(ids)
+
+                # Build one column per header instead of a ragged list of
+                # row lists; pandas allocates a single backing array per
+                # column and the comprehensions keep per-row work minimal.
+                n = len(services)
+                return pd.DataFrame({
+                    "ID": [service_id[:8] + "..." for service_id in ids],
+                    "Name": [s.get("name", "Unknown") for s in services],
+                    "Type": [s.get("type", "unknown").title() for s in services],
+                    "Status": [create_status_badge(s.get("status", "unknown")) for s in services],
+                    "Health": [
+                        create_status_badge(health_map.get(service_id, {}).get("status", "unknown"))
+                        for service_id in ids
+                    ],
+                    "Tools": [
+                        f"{s.get('tool_count') or len(s.get('tools') or ())} tools"
+                        for s in services
+                    ],
+                    "Created": [format_timestamp(s.get("created_at", "")) for s in services],
+                    "Actions": ["Start | Stop | Delete"] * n,
+                })
+
             except Exception as e:
                 logger.error(f"Error loading services: {e}")
-                return pd.DataFrame(columns=["ID", "Name", "Type", "Status", "Health", "Tools", "Created", "Actions"])
+                return _EMPTY_SERVICES_DF.copy()
         
-        def handle_service_action(service_id: str, action: str) -> Tuple[str, pd.DataFrame, Dict[str, Any], Dict[str, Any]]:
-            """Handle service actions (start, stop, restart, delete)."""
+        async def handle_service_action(service_id: str, action: str) -> Tuple[str, Any, Dict[str, Any], Dict[str, Any]]:
+            """Handle service actions (start, stop, restart, delete).
+
+            The table is only refreshed when the registry actually changed
+            (successful delete); validation errors and the placeholder
+            start/stop/restart actions return gr.update() so Gradio leaves
+            the table untouched instead of forcing a list round-trip.
+            """
             if not service_id.strip():
-                return "❌ Please enter a service ID", load_services_list(), {}, {}
-            
+                return "❌ Please enter a service ID", gr.update(), {}, {}
+
             try:
-                api_client = get_api_client()
-                
                 if action == "delete":
-                    result = api_client.delete_service(service_id)
+                    result = await api_client.adelete_service(service_id)
                     if "error" in result:
-                        return f"❌ Failed to delete service: {result['error']}", load_services_list(), {}, {}
-                    return f"✅ Service {service_id} deleted successfully", load_services_list(), {}, {}
-                
+                        return f"❌ Failed to delete service: {result['error']}", gr.update(), {}, {}
+                    invalidate_services_cache()
+                    return f"✅ Service {service_id} deleted successfully", await load_services_list(), {}, {}
+
                 elif action in ["start", "stop", "restart"]:
                     # For now, these are placeholder actions
                     # In a real implementation, these would call specific service control endpoints
-                    return f"✅ Service {action} action completed for {service_id}", load_services_list(), {}, {}
-                
+                    return f"✅ Service {action} action completed for {service_id}", gr.update(), {}, {}
+
                 else:
-                    return f"❌ Unknown action: {action}", load_services_list(), {}, {}
-                
+                    return f"❌ Unknown action: {action}", gr.update(), {}, {}
+
             except Exception as e:
                 logger.error(f"Error performing {action} on service {service_id}: {e}")
-                return f"❌ Error: {str(e)}", load_services_list(), {}, {}
-        
-        def handle_view_service_details(service_id: str) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+                return f"❌ Error: {str(e)}", gr.update(), {}, {}
+
+        # Debounced: the change event fires per keystroke while a service ID
+        # is typed; waiting for the input to settle collapses the storm into
+        # a single pair of backend calls.
+        @debounce(0.3)
+        async def handle_view_service_details(service_id: str) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
             """Handle viewing service details and health."""
             if not service_id.strip():
                 return "❌ Please enter a service ID", {}, {}
-            
+
             try:
-                api_client = get_api_client()
-                
-                # Get service details
-                service_result = api_client.get_service(service_id)
+                # Details and health are independent endpoints; fetch them
+                # concurrently so latency is bounded by the slower of the two.
+                service_result, health_result = await asyncio.gather(
+                    api_client.aget_service(service_id),
+                    api_client.aget_service_health(service_id),
+                    return_exceptions=True
+                )
+
+                if isinstance(service_result, Exception):
+                    return f"❌ Failed to load service: {service_result}", {}, {}
                 if "error" in service_result:
                     return f"❌ Failed to load service: {service_result['error']}", {}, {}
-                
-                # Get service health
-                health_result = api_client.get_service_health(service_id)
-                
+
+                # A failing health check should not hide the service details
+                if isinstance(health_result, Exception):
+                    health_result = {"status": "error", "error": str(health_result)}
+
                 return f"✅ Service details loaded for ID: {service_id}", service_result, health_result
-                
+
             except Exception as e:
                 logger.error(f"Error viewing service details: {e}")
                 return f"❌ Error: {str(e)}", {}, {}
-        
-        # Wire up event handlers
+
+        async def handle_start(service_id: str):
+            return await handle_service_action(service_id, "start")
+
+        async def handle_stop(service_id: str):
+            return await handle_service_action(service_id, "stop")
+
+        async def handle_restart(service_id: str):
+            return await handle_service_action(service_id, "restart")
+
+        async def handle_delete(service_id: str):
+            return await handle_service_action(service_id, "delete")
+
+        async def go_prev_page(page: int) -> Tuple[int, pd.DataFrame]:
+            page = max(0, page - 1)
+            return page, await load_services_list(page)
+
+        async def go_next_page(page: int) -> Tuple[int, pd.DataFrame]:
+            table = await load_services_list(page + 1)
+            if table.empty:
+                # Already on the last page; stay put
+                return page, await load_services_list(page)
+            return page + 1, table
+
+        # Wire up event handlers. The refresh button is throttled so click
+        # storms cap out at one backend round-trip per second; pagination
+        # stays unthrottled since it must always reflect the clicked page.
         refresh_services_btn.click(
-            fn=load_services_list,
+            fn=throttle(1.0)(load_services_list),
+            inputs=[page_state],
             outputs=[services_table]
         )
-        
+
+        prev_page_btn.click(
+            fn=go_prev_page,
+            inputs=[page_state],
+            outputs=[page_state, services_table]
+        )
+
+        next_page_btn.click(
+            fn=go_next_page,
+            inputs=[page_state],
+            outputs=[page_state, services_table]
+        )
+
         start_btn.click(
-            fn=lambda service_id: handle_service_action(service_id, "start"),
+            fn=handle_start,
             inputs=[selected_service_id],
             outputs=[action_status, services_table, service_details, health_status]
         )
-        
+
         stop_btn.click(
-            fn=lambda service_id: handle_service_action(service_id, "stop"),
+            fn=handle_stop,
             inputs=[selected_service_id],
             outputs=[action_status, services_table, service_details, health_status]
         )
-        
+
         restart_btn.click(
-            fn=lambda service_id: handle_service_action(service_id, "restart"),
+            fn=handle_restart,
             inputs=[selected_service_id],
             outputs=[action_status, services_table, service_details, health_status]
         )
-        
+
         delete_service_btn.click(
-            fn=lambda service_id: handle_service_action(service_id, "delete"),
+            fn=handle_delete,
             inputs=[selected_service_id],
             outputs=[action_status, services_table, service_details, health_status]
         )
@@ -1,19 +1,33 @@
 """Service testing interface for interactive tool testing."""
 
+import asyncio
 import gradio as gr
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 import logging
 import json
 
-from ..api_client import get_api_client
+import fastjsonschema
+import orjson
+
+from ..api_client import cached_list_services, get_api_client
 from ..components.common import (
     create_error_display, create_success_display, create_info_display,
     format_json_display, create_refresh_button, create_action_button,
-    validate_json_input, create_help_text
+    validate_json_input, create_help_text, throttle
 )
 
 logger = logging.getLogger(__name__)
 
+# Template defaults per JSON-schema type; mutable values are copied per
+# parameter so templates never share state.
+_PARAM_DEFAULTS = {
+    "string": "",
+    "number": 0,
+    "boolean": False,
+    "array": [],
+    "object": {},
+}
+
 
 def create_service_testing_interface() -> gr.Tab:
     """Create the service testing interface tab.
@@ -22,6 +36,9 @@ def create_service_testing_interface() -> gr.Tab:
         Gradio Tab component with service testing interface
     """
     with gr.Tab("🧪 Service Testing") as tab:
+        # Capture the client singleton once; handlers close over it instead
+        # of re-resolving it on every invocation.
+        api_client = get_api_client()
         gr.Markdown("## Service Testing Interface")
         gr.Markdown("Test your MCP services interactively with dynamic parameter forms.")
         
@@ -29,35 +46,12 @@ def create_service_testing_interface() -> gr.Tab:
         with gr.Group():
             gr.Markdown("### Select Service and Tool")
             with gr.Row():
-                # Load services automatically on initialization
-                def load_initial_services():
-                    """Load services on page initialization."""
-                    try:
-                        api_client = get_api_client()
-                        result = api_client.list_services()
-
-                        if "error" in result:
-                            logger.error(f"Failed to load initial services: {result['error']}")
-                            return []
-
-                        services = result.get("services", [])
-                        choices = []
-                        for service in services:
-                            service_id = service.get("service_id", "")
-                            name = service.get("name", "Unknown")
-                            choices.append((f"{name} ({service_id[:8]}...)", service_id))
-
-                        logger.info(f"Loaded {len(choices)} services on initialization")
-                        return choices
-                    except Exception as e:
-                        logger.error(f"Error loading initial services: {e}")
-                        return []
-
-                initial_service_choices = load_initial_services()
-
+                # The dropdown starts empty and is populated asynchronously
+                # when the tab is first opened, so app construction never
+                # blocks on a slow or unreachable backend.
                 service_dropdown = gr.Dropdown(
                     label="Select Service",
-                    choices=initial_service_choices,
+                    choices=[],
                     interactive=True,
                     allow_custom_value=False
                 )
@@ -140,39 +134,48 @@ def create_service_testing_interface() -> gr.Tab:
         
         # Event handlers
 
-        
-        def handle_service_selection(service_id: str) -> Tuple[gr.Dropdown, List[str], Dict[str, Any]]:
+        # Parameter-schema validators compiled once per tool; validation per
+        # click is then a single compiled-function call instead of an
+        # interpreter walk over the schema.
+        validators: Dict[str, Callable] = {}
+
+
+        async def handle_service_selection(service_id: str) -> Tuple[Any, List[str], Dict[str, Any]]:
             """Handle service selection and load available tools."""
             if not service_id:
-                return gr.Dropdown(visible=False), [], {}
-            
+                return gr.update(visible=False), [], {}
+
             try:
-                api_client = get_api_client()
-                
                 # Get service details
-                service_result = api_client.get_service(service_id)
+                service_result = await api_client.aget_service(service_id)
                 if "error" in service_result:
-                    return gr.Dropdown(visible=False), [], {"error": service_result["error"]}
+                    return gr.update(visible=False), [], {"error": service_result["error"]}
                 
                 # Extract tools from service
                 tools = service_result.get("tools", [])
                 tool_choices = []
-                
+
                 for tool in tools:
                     tool_name = tool.get("name", "")
                     tool_description = tool.get("description", "No description")
                     tool_choices.append(f"{tool_name} - {tool_description}")
-                
+
+                # Index tools by name so handle_tool_selection resolves the
+                # clicked tool with one dict lookup instead of a linear scan.
+                service_result["_tools_by_name"] = {
+                    tool.get("name", ""): tool for tool in tools
+                }
+
                 if tool_choices:
-                    return gr.Dropdown(visible=True, choices=tool_choices), tool_choices, service_result
+                    return gr.update(visible=True, choices=tool_choices), tool_choices, service_result
                 else:
-                    return gr.Dropdown(visible=False), [], {"message": "No tools found in this service"}
+                    return gr.update(visible=False), [], {"message": "No tools found in this service"}
                 
             except Exception as e:
                 logger.error(f"Error handling service selection: {e}")
-                return gr.Dropdown(visible=False), [], {"error": str(e)}
+                return gr.update(visible=False), [], {"error": str(e)}
         
-        def handle_tool_selection(tool_name: str, service_data: Dict[str, Any]) -> Tuple[gr.Group, gr.Group, Dict[str, Any], str]:
+        async def handle_tool_selection(tool_name: str, service_data: Dict[str, Any]) -> Tuple[gr.Group, gr.Group, Dict[str, Any], str]:
             """Handle tool selection and show parameter form."""
             if not tool_name or not service_data:
                 return gr.Group(visible=False), gr.Group(visible=False), {}, "{}"
@@ -181,18 +184,21 @@ def create_service_testing_interface() -> gr.Tab:
                 # Extract tool name from the dropdown selection
                 actual_tool_name = tool_name.split(" - ")[0] if " - " in tool_name else tool_name
                 
-                # Find the tool in service data
-                tools = service_data.get("tools", [])
-                selected_tool = None
-                
-                for tool in tools:
-                    if tool.get("name") == actual_tool_name:
-                        selected_tool = tool
-                        break
-                
+                # Look up the tool in the name index built at selection time
+                selected_tool = service_data.get("_tools_by_name", {}).get(actual_tool_name)
+
                 if not selected_tool:
                     return gr.Group(visible=False), gr.Group(visible=False), {"error": "Tool not found"}, "{}"
                 
+                # Compile the tool's parameter schema once for fast validation
+                if actual_tool_name not in validators:
+                    try:
+                        validators[actual_tool_name] = fastjsonschema.compile(
+                            selected_tool.get("parameters", {})
+                        )
+                    except Exception as e:
+                        logger.warning(f"Could not compile schema for {actual_tool_name}: {e}")
+
                 # Generate parameter template
                 parameters = selected_tool.get("parameters", {})
                 properties = parameters.get("properties", {})
@@ -202,21 +208,19 @@ def create_service_testing_interface() -> gr.Tab:
                 for param_name, param_info in properties.items():
                     param_type = param_info.get("type", "string")
                     param_default = param_info.get("default")
-                    
+
                     if param_default is not None:
                         param_template[param_name] = param_default
-                    elif param_type == "string":
-                        param_template[param_name] = ""
-                    elif param_type == "number":
-                        param_template[param_name] = 0
-                    elif param_type == "boolean":
-                        param_template[param_name] = False
-                    elif param_type == "array":
-                        param_template[param_name] = []
-                    elif param_type == "object":
-                        param_template[param_name] = {}
+                    else:
+                        default = _PARAM_DEFAULTS.get(param_type)
+                        if isinstance(default, (list, dict)):
+                            default = default.copy()
+                        if default is not None:
+                            param_template[param_name] = default
                 
-                param_json = json.dumps(param_template, indent=2)
+                param_json = orjson.dumps(
+                    param_template, option=orjson.OPT_INDENT_2
+                ).decode()
                 
                 return (
                     gr.Group(visible=True),
@@ -229,63 +233,88 @@ def create_service_testing_interface() -> gr.Tab:
                 logger.error(f"Error handling tool selection: {e}")
                 return gr.Group(visible=False), gr.Group(visible=False), {"error": str(e)}, "{}"
         
-        def validate_parameters(params_json: str) -> str:
-            """Validate parameter JSON."""
+        def validate_parameters(tool_name: str, params_json: str) -> str:
+            """Validate parameter JSON against the selected tool's schema."""
             is_valid, data, error = validate_json_input(params_json)
-            
+
             if not is_valid:
                 return f"❌ Invalid JSON: {error}"
-            
+
+            actual_tool_name = tool_name.split(" - ")[0] if tool_name and " - " in tool_name else tool_name
+            validator = validators.get(actual_tool_name)
+            if validator is not None:
+                try:
+                    validator(data)
+                except fastjsonschema.JsonSchemaException as e:
+                    return f"❌ Schema validation failed: {e.message}"
+                return "✅ Parameters match the tool schema"
+
             return "✅ Parameters are valid JSON"
         
-        def execute_tool_test(service_id: str, tool_name: str, params_json: str) -> Tuple[str, Dict[str, Any], str]:
-            """Execute the tool test."""
+        async def execute_tool_test(
+            service_id: str, tool_name: str, params_json: str
+        ) -> AsyncIterator[Tuple[str, Dict[str, Any], str, str]]:
+            """Execute the tool test, streaming partial output as it arrives."""
             if not all([service_id, tool_name, params_json]):
-                return "❌ Please select a service, tool, and provide parameters", {}, ""
-            
+                yield "❌ Please select a service, tool, and provide parameters", {}, "", ""
+                return
+
             try:
                 # Validate parameters
                 is_valid, params_data, error = validate_json_input(params_json)
                 if not is_valid:
-                    return f"❌ Invalid parameters: {error}", {}, ""
-                
-                # For now, this is a mock implementation
-                # In a real implementation, this would call the actual tool via the MCP protocol
+                    yield f"❌ Invalid parameters: {error}", {}, "", ""
+                    return
+
+                yield "⏳ Executing tool...", {}, "", ""
+
+                # For now, this is a mock implementation that streams in
+                # chunks. Real MCP integration will iterate over the
+                # wrapper's stdout lines here and yield each one.
+                mock_chunks = [
+                    f"Starting tool '{tool_name}'...\n",
+                    f"Parameters: {params_data}\n",
+                    "Execution complete.\n",
+                ]
+
+                streamed = ""
+                for chunk in mock_chunks:
+                    streamed += chunk
+                    yield "⏳ Executing tool...", {}, "", streamed
+                    await asyncio.sleep(0)
+
                 mock_response = {
                     "status": "success",
                     "result": f"Mock response for tool '{tool_name}' with parameters: {params_data}",
                     "execution_time": "0.123s",
                     "timestamp": "2025-06-03T12:00:00Z"
                 }
-                
-                raw_output = json.dumps(mock_response, indent=2)
-                
-                return "✅ Tool executed successfully", mock_response, raw_output
-                
+
+                raw_output = orjson.dumps(
+                    mock_response, option=orjson.OPT_INDENT_2
+                ).decode()
+
+                yield "✅ Tool executed successfully", mock_response, raw_output, streamed
+
             except Exception as e:
                 logger.error(f"Error executing tool test: {e}")
-                return f"❌ Error: {str(e)}", {}, ""
+                yield f"❌ Error: {str(e)}", {}, "", ""
         
         def clear_results() -> Tuple[str, Dict[str, Any], str, str]:
             """Clear all test results."""
             return "", {}, "", ""
         
-        # Wire up event handlers
-        def update_service_dropdown():
+        # Wire up event handlers. Throttled: refresh-button spam and rapid
+        # tab switches collapse to one listing fetch per second.
+        @throttle(1.0)
+        async def update_service_dropdown():
             """Update service dropdown with fresh data."""
             try:
-                api_client = get_api_client()
-                result = api_client.list_services()
+                result = await cached_list_services()
 
                 if "error" in result:
                     logger.error(f"Failed to load services: {result['error']}")
-                    return gr.Dropdown(
-                        label="Select Service",
-                        choices=[],
-                        value=None,
-                        interactive=True,
-                        allow_custom_value=False
-                    )
+                    return gr.update(choices=[], value=None)
 
                 services = result.get("services", [])
                 choices = []
@@ -295,28 +324,22 @@ def create_service_testing_interface() -> gr.Tab:
                     choices.append((f"{name} ({service_id[:8]}...)", service_id))
 
                 logger.info(f"Loaded {len(choices)} services for dropdown")
-                return gr.Dropdown(
-                    label="Select Service",
-                    choices=choices,
-                    value=None,
-                    interactive=True,
-                    allow_custom_value=False
-                )
+                return gr.update(choices=choices, value=None)
 
             except Exception as e:
                 logger.error(f"Error loading services: {e}")
-                return gr.Dropdown(
-                    label="Select Service",
-                    choices=[],
-                    value=None,
-                    interactive=True,
-                    allow_custom_value=False
-                )
+                return gr.update(choices=[], value=None)
 
         refresh_services_btn.click(
             fn=update_service_dropdown,
             outputs=[service_dropdown]
         )
+
+        # Populate the dropdown lazily when the tab is opened
+        tab.select(
+            fn=update_service_dropdown,
+            outputs=[service_dropdown]
+        )
         
         service_dropdown.change(
             fn=handle_service_selection,
@@ -332,14 +355,14 @@ def create_service_testing_interface() -> gr.Tab:
         
         validate_params_btn.click(
             fn=validate_parameters,
-            inputs=[parameters_json],
+            inputs=[tool_dropdown, parameters_json],
             outputs=[param_validation_status]
         )
         
         execute_btn.click(
             fn=execute_tool_test,
             inputs=[service_dropdown, tool_dropdown, parameters_json],
-            outputs=[execution_status, response_display, raw_output]
+            outputs=[execution_status, response_display, raw_output, streaming_output]
         )
         
         clear_btn.click(
@@ -2,6 +2,8 @@
 
 import gradio as gr
 import logging
+import threading
+import time
 from typing import Optional
 import os
 import sys
@@ -12,22 +14,18 @@ if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
 from .api_client import get_api_client, close_api_client
-from .interfaces.file_management import create_file_management_interface
-from .interfaces.service_config import create_service_config_interface
-from .interfaces.service_management import create_service_management_interface
-from .interfaces.service_testing import create_service_testing_interface
 
 logger = logging.getLogger(__name__)
 
+# Short-TTL cache for the backend status line so refresh clicks and
+# app.load events within the window skip the health round-trip.
+_STATUS_TTL = 3.0
+_status_cache = {"ts": 0.0, "value": None}
+_status_lock = threading.Lock()
 
-def create_gradio_app() -> gr.Blocks:
-    """Create the main Gradio application.
-    
-    Returns:
-        Gradio Blocks application
-    """
-    # Custom CSS for better styling
-    custom_css = """
+# Custom CSS for better styling; module-level so the literal is built once
+# at import instead of on every create_gradio_app() call.
+_CUSTOM_CSS = """
     .error-message {
         color: #dc3545 !important;
         background-color: #f8d7da !important;
@@ -80,10 +78,73 @@ def create_gradio_app() -> gr.Blocks:
         border-bottom: 2px solid #dee2e6 !important;
     }
     """
-    
+
+# Static tab copy, built once at import time so repeated app construction
+# (tests, reloads, embedding) reuses the same interned strings.
+_CONFIG_PLACEHOLDER_MD = """
+This tab will include:
+- JSON/YAML configuration editor
+- Configuration templates
+- Import/export functionality
+- Configuration validation
+"""
+
+_HELP_MD = """
+## Getting Started
+
+### 1. Upload a Python Script
+- Go to the **File Management** tab
+- Click "Select Python File" and choose a .py file
+- Click "Upload Script" to upload and analyze the file
+
+### 2. Configure a Service
+- Go to the **Service Configuration** tab
+- Select your uploaded script from the dropdown
+- Choose hosting mode (Function or Executable)
+- Configure the service settings
+- Click "Create Service" to deploy
+
+### 3. Manage Services
+- Use the **Service Management** tab to monitor and control services
+- View real-time status, logs, and performance metrics
+- Start, stop, or restart services as needed
+
+### 4. Test Services
+- Use the **Service Testing** tab to test your MCP tools
+- Fill in parameters and see real-time responses
+- Save and reuse test configurations
+
+## About MCP (Model Context Protocol)
+
+MCP is a protocol that allows AI models to securely access external tools and data sources.
+This interface helps you convert Python scripts into MCP-compatible services that can be
+used by AI models and other applications.
+
+## Support
+
+- **Backend API**: Running on http://localhost:8090
+- **Web Interface**: Running on http://localhost:7860
+- **Documentation**: Check the project README for detailed information
+"""
+
+
+def create_gradio_app() -> gr.Blocks:
+    """Create the main Gradio application.
+
+    Returns:
+        Gradio Blocks application
+    """
+    # Deferred imports: the interface modules drag in the full Gradio
+    # component chain, so importing this module stays cheap and only
+    # building the app pays the cost.
+    from .interfaces.file_management import create_file_management_interface
+    from .interfaces.service_config import create_service_config_interface
+    from .interfaces.service_management import create_service_management_interface
+    from .interfaces.service_testing import create_service_testing_interface
+
     with gr.Blocks(
         title="mcpy-lens Web Interface",
-        css=custom_css,
+        css=_CUSTOM_CSS,
         theme=gr.themes.Soft()
     ) as app:
         # Header
@@ -100,29 +161,61 @@ def create_gradio_app() -> gr.Blocks:
         )
         
         # Backend status check
-        def check_backend_status() -> str:
-            """Check if the FastAPI backend is accessible."""
+        async def check_backend_status() -> str:
+            """Check if the FastAPI backend is accessible (cached, async)."""
+            with _status_lock:
+                now = time.monotonic()
+                if (
+                    _status_cache["value"] is not None
+                    and now - _status_cache["ts"] < _STATUS_TTL
+                ):
+                    return _status_cache["value"]
+
+            # Probe outside the lock: the pooled async client costs one
+            # event-loop task per refresh instead of a worker thread.
             try:
                 api_client = get_api_client()
-                health = api_client.health_check()
+                health = await api_client.ahealth_check()
 
                 if health.get("status") == "healthy":
-                    return "✅ **Backend Status**: Connected to FastAPI backend"
+                    value = "✅ **Backend Status**: Connected to FastAPI backend"
                 else:
-                    return f"⚠️ **Backend Status**: {health.get('message', 'Unknown status')}"
+                    value = f"⚠️ **Backend Status**: {health.get('message', 'Unknown status')}"
             except Exception as e:
-                return f"❌ **Backend Status**: Cannot connect to FastAPI backend - {str(e)}\n\n**Note**: Start the FastAPI backend with `python run.py` in another terminal."
-        
-        # Status display
-        backend_status = gr.Markdown(check_backend_status())
-        
+                value = f"❌ **Backend Status**: Cannot connect to FastAPI backend - {str(e)}\n\n**Note**: Start the FastAPI backend with `python run.py` in another terminal."
+
+            with _status_lock:
+                _status_cache["ts"] = time.monotonic()
+                _status_cache["value"] = value
+            return value
+
+        _last_pushed_hash: list = [None]
+
+        async def refresh_backend_status():
+            """Re-render the status line only when the text changed.
+
+            Returning gr.skip() for an identical status avoids pushing a
+            component update (and the client re-render) on spammy refresh.
+            """
+            value = await check_backend_status()
+            h = hash(value)
+            if h == _last_pushed_hash[0]:
+                return gr.skip()
+            _last_pushed_hash[0] = h
+            return value
+
+        # Status display; populated asynchronously by app.load so building
+        # the app never blocks on the health probe.
+        backend_status = gr.Markdown("⏳ **Backend Status**: Checking...")
+
         # Refresh status button
         with gr.Row():
             refresh_status_btn = gr.Button("🔄 Refresh Backend Status", variant="secondary", size="sm")
-        
+
         refresh_status_btn.click(
-            fn=check_backend_status,
-            outputs=[backend_status]
+            fn=refresh_backend_status,
+            outputs=[backend_status],
+            show_progress=False
         )
         
         # Main interface tabs
@@ -145,53 +238,11 @@ def create_gradio_app() -> gr.Blocks:
                 gr.Markdown("*Coming soon - manage service configurations*")
                 
                 # Placeholder content
-                gr.Markdown("""
-                This tab will include:
-                - JSON/YAML configuration editor
-                - Configuration templates
-                - Import/export functionality
-                - Configuration validation
-                """)
-            
+                gr.Markdown(_CONFIG_PLACEHOLDER_MD)
+
             # Help Tab
             with gr.Tab("❓ Help") as help_tab:
-                gr.Markdown("""
-                ## Getting Started
-                
-                ### 1. Upload a Python Script
-                - Go to the **File Management** tab
-                - Click "Select Python File" and choose a .py file
-                - Click "Upload Script" to upload and analyze the file
-                
-                ### 2. Configure a Service
-                - Go to the **Service Configuration** tab
-                - Select your uploaded script from the dropdown
-                - Choose hosting mode (Function or Executable)
-                - Configure the service settings
-                - Click "Create Service" to deploy
-                
-                ### 3. Manage Services
-                - Use the **Service Management** tab to monitor and control services
-                - View real-time status, logs, and performance metrics
-                - Start, stop, or restart services as needed
-                
-                ### 4. Test Services
-                - Use the **Service Testing** tab to test your MCP tools
-                - Fill in parameters and see real-time responses
-                - Save and reuse test configurations
-                
-                ## About MCP (Model Context Protocol)
-                
-                MCP is a protocol that allows AI models to securely access external tools and data sources.
-                This interface helps you convert Python scripts into MCP-compatible services that can be
-                used by AI models and other applications.
-                
-                ## Support
-                
-                - **Backend API**: Running on http://localhost:8090
-                - **Web Interface**: Running on http://localhost:7860
-                - **Documentation**: Check the project README for detailed information
-                """)
+                gr.Markdown(_HELP_MD)
         
         # Footer
         gr.Markdown(
@@ -206,8 +257,9 @@ def create_gradio_app() -> gr.Blocks:
         
         # Load initial backend status
         app.load(
-            fn=check_backend_status,
-            outputs=[backend_status]
+            fn=refresh_backend_status,
+            outputs=[backend_status],
+            show_progress=False
         )
     
     return app
@@ -227,12 +279,12 @@ def main():
         # Create and launch the Gradio app
         app = create_gradio_app()
         
-        # Launch with custom settings
+        # Launch with custom settings; debug mode only when developing
         app.launch(
             server_name="0.0.0.0",
             server_port=7860,
             share=False,
-            debug=True,
+            debug=os.getenv("MCPY_DEV") == "1",
             show_error=True,
             quiet=False
         )
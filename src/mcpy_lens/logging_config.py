@@ -1,14 +1,50 @@
 """Enhanced logging configuration with rotation and persistence."""
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 
-from pythonjsonlogger import jsonlogger
+import orjson
 
 from mcpy_lens.config import get_settings
 
 
+class OrjsonFormatter(logging.Formatter):
+    """JSON log formatter backed by orjson.
+
+    Emits the same fields as the previous ``jsonlogger.JsonFormatter``
+    configuration but serializes through orjson's Rust encoder instead of
+    the stdlib ``json`` module.
+    """
+
+    _KEYS = ("asctime", "name", "levelname", "pathname", "lineno", "message")
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        payload = {key: getattr(record, key, None) for key in self._KEYS}
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
+
+
+# Listener threads from the current setup_logging call; setup_logging can
+# run more than once per boot (main() and the app lifespan both call it),
+# so stale listeners must be stopped instead of leaking until exit
+_queue_listeners: list[logging.handlers.QueueListener] = []
+
+
+def _stop_queue_listeners() -> None:
+    """Stop listener threads started by a previous setup_logging call."""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
+atexit.register(_stop_queue_listeners)
+
+
 def setup_logging(
     log_level: str | None = None,
     enable_file_logging: bool = True,
@@ -37,18 +73,17 @@ def setup_logging(
     )
 
     # Create JSON formatter for file logging
-    json_formatter = jsonlogger.JsonFormatter(
-        fmt="%(asctime)s %(name)s %(levelname)s %(pathname)s %(lineno)d %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    json_formatter = OrjsonFormatter(datefmt="%Y-%m-%d %H:%M:%S")
 
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates, and stop listener
+    # threads from a previous call so repeated setup doesn't leak them
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_queue_listeners()
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -74,17 +109,35 @@ def setup_logging(
 
         file_handler.setLevel(level)
         file_handler.setFormatter(json_formatter)
-        root_logger.addHandler(file_handler)
 
-        # Error-specific log file
+        # Error-specific log file; rotated like the main log so error
+        # storms cannot grow it unbounded (5MB max, keep 3 backups)
         error_log_file = settings.logs_dir / "errors.log"
-        error_handler = logging.FileHandler(filename=error_log_file, encoding="utf-8")
+        error_handler = logging.handlers.RotatingFileHandler(
+            filename=error_log_file,
+            maxBytes=5 * 1024 * 1024,  # 5MB
+            backupCount=3,
+            encoding="utf-8",
+        )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(json_formatter)
-        root_logger.addHandler(error_handler)
 
-        # Access log for FastAPI (separate logger)
+        # File handlers sit behind a queue so request threads only pay an
+        # enqueue; JSON formatting and disk writes happen on the listener's
+        # background thread.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, error_handler, respect_handler_level=True
+        )
+        listener.start()
+        _queue_listeners.append(listener)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        # Access log for FastAPI (separate logger); clear handlers from a
+        # previous call so access records don't get duplicated
         access_logger = logging.getLogger("uvicorn.access")
+        for handler in access_logger.handlers[:]:
+            access_logger.removeHandler(handler)
         access_log_file = settings.logs_dir / "access.log"
 
         if enable_rotation:
@@ -100,7 +153,16 @@ def setup_logging(
             )
 
         access_handler.setFormatter(json_formatter)
-        access_logger.addHandler(access_handler)
+
+        # Access logging gets its own queue so a burst of request logs
+        # cannot delay application/error records.
+        access_queue: queue.SimpleQueue = queue.SimpleQueue()
+        access_listener = logging.handlers.QueueListener(
+            access_queue, access_handler, respect_handler_level=True
+        )
+        access_listener.start()
+        _queue_listeners.append(access_listener)
+        access_logger.addHandler(logging.handlers.QueueHandler(access_queue))
 
     # Configure specific loggers
     logging.getLogger("uvicorn").setLevel(level)
@@ -1,21 +1,34 @@
 """Main entry point for mcpy-lens application."""
 
+import os
+
 import uvicorn
 
 from mcpy_lens.app import fastapi_app
+from mcpy_lens.health_interceptor import HealthCheckInterceptor
 from mcpy_lens.logging_config import setup_logging
 
-app = fastapi_app
+# Health probes are answered by the pure-ASGI interceptor without entering
+# the FastAPI middleware stack; all other requests pass straight through.
+app = HealthCheckInterceptor(fastapi_app)
 
 
 def main() -> None:
     """Main entry point for the application."""
     setup_logging()
+    # Auto-reload spins up watchfiles' filesystem watcher; only pay for it
+    # when explicitly developing (MCPY_DEV=1).
+    dev_mode = os.getenv("MCPY_DEV") == "1"
+    # Multiple workers scale CPU-bound validation/discovery across cores.
+    # Defaults to 1 because dynamically registered service routes live in
+    # process memory; raise MCPY_WORKERS only when serving static routes.
+    workers = 1 if dev_mode else int(os.getenv("MCPY_WORKERS", "1"))
     uvicorn.run(
-        "mcpy_lens.app:fastapi_app",
+        "mcpy_lens.main:app",
         host="0.0.0.0",
         port=8090,
-        reload=True,
+        reload=dev_mode,
+        workers=workers,
         log_level="info",
     )
 
@@ -1,45 +1,139 @@
 """Pydantic models for mcpy-lens API."""
 
-from datetime import datetime
-from enum import Enum
+import sys
+import time
+from datetime import datetime, timezone
+from enum import IntEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_serializer,
+    field_validator,
+)
+
+# Shared model configuration: keeps validation on Pydantic's Rust fast
+# paths and disables machinery (assignment validation, arbitrary types)
+# that none of these request/response models use. defer_build stays off
+# so schemas compile eagerly at import instead of on the first request.
+_FAST = ConfigDict(
+    frozen=False,
+    extra="ignore",
+    validate_assignment=False,
+    arbitrary_types_allowed=False,
+    populate_by_name=True,
+    defer_build=False,
+)
+
+
+# One-slot timestamp cache: bursts of model instantiations within the same
+# millisecond share a single immutable datetime instead of each paying a
+# clock read plus an allocation.
+_now_cache: list = [0.0, datetime.fromtimestamp(0.0, tz=timezone.utc)]
+
+
+def _utc_now() -> datetime:
+    """Shared timestamp factory for model defaults (1 ms granularity)."""
+    t = time.time()
+    if t - _now_cache[0] > 0.001:
+        _now_cache[0] = t
+        _now_cache[1] = datetime.fromtimestamp(t, tz=timezone.utc)
+    return _now_cache[1]
+
 
 # ——— Status and health models ———
 
 
-class ServiceStatus(str, Enum):
-    """Service status enumeration."""
+class ServiceStatus(IntEnum):
+    """Service status enumeration.
+
+    Int-backed so hot-path comparisons (``status == ServiceStatus.ACTIVE``)
+    are integer compares; the JSON wire form stays the lowercase string via
+    ``_missing_`` on input and per-field serializers on output.
+    """
+
+    ACTIVE = 1
+    INACTIVE = 2
+    ERROR = 3
+
+    def __str__(self) -> str:
+        return _STATUS_NAMES[self]
 
-    ACTIVE = "active"
-    INACTIVE = "inactive"
-    ERROR = "error"
+    @classmethod
+    def _missing_(cls, value: object) -> "ServiceStatus | None":
+        if isinstance(value, str):
+            return _STATUS_BY_NAME.get(value.lower())
+        return None
+
+
+_STATUS_NAMES = {
+    ServiceStatus.ACTIVE: "active",
+    ServiceStatus.INACTIVE: "inactive",
+    ServiceStatus.ERROR: "error",
+}
+_STATUS_BY_NAME = {name: status for status, name in _STATUS_NAMES.items()}
 
 
 class HealthCheckResponse(BaseModel):
     """Health check response model."""
 
+    model_config = _FAST
+
     status: str = Field(description="Service status")
     version: str = Field(description="Application version")
     message: str | None = Field(default=None, description="Additional status message")
     timestamp: datetime = Field(
-        default_factory=datetime.now, description="Response timestamp"
+        default_factory=_utc_now, description="Response timestamp"
     )
 
 
+# Pre-serialized template for the healthy response: /health is the hottest
+# endpoint (Gradio refresh plus liveness probes), so answering it is a
+# bytes interpolation instead of a Pydantic model build and serialization.
+_HEALTH_TEMPLATE = (
+    b'{"status":"healthy","version":"%s",'
+    b'"message":"mcpy-lens service is running","timestamp":"%s"}'
+)
+
+
+def healthy_bytes(version: str) -> bytes:
+    """Serialized healthy HealthCheckResponse body for the given version."""
+    return _HEALTH_TEMPLATE % (version.encode(), _utc_now().isoformat().encode())
+
+
 class ErrorResponse(BaseModel):
     """Error response model."""
 
+    model_config = _FAST
+
     error: str = Field(description="Error type")
     message: str = Field(description="Error message")
     details: dict[str, Any] | None = Field(
         default=None, description="Additional error details"
     )
     timestamp: datetime = Field(
-        default_factory=datetime.now, description="Error timestamp"
+        default_factory=_utc_now, description="Error timestamp"
     )
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes via orjson.
+
+        Skips the model_dump → dict → json chain; error handlers hand the
+        result to a raw Response.
+        """
+        return orjson.dumps(
+            {
+                "error": self.error,
+                "message": self.message,
+                "details": self.details,
+                "timestamp": self.timestamp.isoformat(),
+            }
+        )
+
 
 # ——— File upload models ———
 
@@ -47,11 +141,13 @@ class ErrorResponse(BaseModel):
 class FileUploadResponse(BaseModel):
     """File upload response model."""
 
+    model_config = _FAST
+
     file_id: str = Field(description="Unique file identifier")
     filename: str = Field(description="Original filename")
     size: int = Field(description="File size in bytes")
     uploaded_at: datetime = Field(
-        default_factory=datetime.now, description="Upload timestamp"
+        default_factory=_utc_now, description="Upload timestamp"
     )
     status: str = Field(default="uploaded", description="Upload status")
 
@@ -59,49 +155,121 @@ class FileUploadResponse(BaseModel):
 # ——— Service management models ———
 
 
+# Routes shared by services that do not override them. A single interned
+# tuple means the common case allocates nothing per response; the wire
+# form is unchanged.
+DEFAULT_ROUTES: tuple[str, ...] = tuple(
+    sys.intern(r) for r in ("/invoke", "/healthz", "/sse")
+)
+
+
+class ServiceMetadata(BaseModel):
+    """Typed metadata attached to a service.
+
+    A closed schema instead of ``dict[str, Any]`` lets Pydantic validate
+    through a fixed fast path rather than the generic Any walker, and
+    keeps the OpenAPI schema concrete for clients.
+    """
+
+    model_config = _FAST
+
+    owner: str | None = Field(default=None, description="Owning user or team")
+    description: str = Field(default="", description="Free-form description")
+    tags: list[str] = Field(default_factory=list, description="Search tags")
+    env: dict[str, str] = Field(
+        default_factory=dict, description="Environment overrides for the service"
+    )
+
+
 class ServiceInfo(BaseModel):
     """Service information model."""
 
+    model_config = _FAST
+
     service_id: str = Field(description="Unique service identifier")
     name: str = Field(description="Service name")
     version: str = Field(description="Service version")
     status: ServiceStatus = Field(description="Current service status")
-    routes: list[str] = Field(description="Available routes for this service")
-    metadata: dict[str, Any] = Field(
-        default_factory=dict, description="Service metadata"
+    routes: tuple[str, ...] = Field(description="Available routes for this service")
+    metadata: ServiceMetadata = Field(
+        default_factory=ServiceMetadata, description="Service metadata"
     )
     created_at: datetime = Field(
-        default_factory=datetime.now, description="Service creation timestamp"
+        default_factory=_utc_now, description="Service creation timestamp"
     )
 
+    @field_validator("routes", mode="before")
+    @classmethod
+    def _intern_routes(cls, v: Any) -> tuple[str, ...]:
+        """Intern route strings so identical routes share one object."""
+        if v is DEFAULT_ROUTES:
+            return v
+        return tuple(sys.intern(s) for s in v)
+
+    @field_serializer("status")
+    def _serialize_status(self, v: ServiceStatus) -> str:
+        return _STATUS_NAMES[v]
+
+    @classmethod
+    def with_default_routes(cls, **data: Any) -> "ServiceInfo":
+        """Construct a ServiceInfo that exposes the standard routes."""
+        return cls(routes=DEFAULT_ROUTES, **data)
+
 
 class ServiceListResponse(BaseModel):
     """Response model for listing services."""
 
+    model_config = _FAST
+
     services: list[ServiceInfo] = Field(description="List of registered services")
     total: int = Field(description="Total number of services")
 
+    @classmethod
+    def from_trusted(cls, services: list[ServiceInfo]) -> "ServiceListResponse":
+        """Assemble from already-validated ServiceInfo objects.
+
+        Skips re-validating each item via model_construct; only for
+        internally produced data.
+        """
+        return cls.model_construct(services=services, total=len(services))
+
 
 class ServiceRegistrationRequest(BaseModel):
     """Request model for service registration."""
 
+    model_config = _FAST
+
     name: str = Field(description="Service name")
     version: str = Field(default="1.0.0", description="Service version")
-    metadata: dict[str, Any] = Field(
-        default_factory=dict, description="Service metadata"
+    metadata: ServiceMetadata = Field(
+        default_factory=ServiceMetadata, description="Service metadata"
     )
 
 
 class ServiceRegistrationResponse(BaseModel):
     """Response model for service registration."""
 
+    model_config = _FAST
+
     service_id: str = Field(description="Generated service identifier")
     name: str = Field(description="Service name")
     version: str = Field(description="Service version")
     status: ServiceStatus = Field(description="Registration status")
-    routes: list[str] = Field(description="Registered routes")
+    routes: tuple[str, ...] = Field(description="Registered routes")
     message: str = Field(description="Registration result message")
 
+    @field_validator("routes", mode="before")
+    @classmethod
+    def _intern_routes(cls, v: Any) -> tuple[str, ...]:
+        """Intern route strings so identical routes share one object."""
+        if v is DEFAULT_ROUTES:
+            return v
+        return tuple(sys.intern(s) for s in v)
+
+    @field_serializer("status")
+    def _serialize_status(self, v: ServiceStatus) -> str:
+        return _STATUS_NAMES[v]
+
 
 # ——— Tool discovery models ———
 
@@ -109,6 +277,8 @@ class ServiceRegistrationResponse(BaseModel):
 class ToolInfo(BaseModel):
     """Tool information model."""
 
+    model_config = _FAST
+
     name: str = Field(description="Tool name")
     description: str = Field(description="Tool description")
     parameters: dict[str, Any] = Field(description="Tool parameters schema")
@@ -118,11 +288,13 @@ class ToolInfo(BaseModel):
 class ToolDiscoveryResponse(BaseModel):
     """Response model for tool discovery."""
 
+    model_config = _FAST
+
     file_id: str = Field(description="Source file identifier")
     tools: list[ToolInfo] = Field(description="Discovered tools")
     total: int = Field(description="Total number of tools found")
     discovery_time: datetime = Field(
-        default_factory=datetime.now, description="Discovery timestamp"
+        default_factory=_utc_now, description="Discovery timestamp"
     )
 
 
@@ -132,6 +304,8 @@ class ToolDiscoveryResponse(BaseModel):
 class FunctionInfo(BaseModel):
     """Information about a discovered function."""
 
+    model_config = _FAST
+
     name: str = Field(description="Function name")
     description: str = Field(description="Function description from docstring")
     parameters: dict[str, Any] = Field(description="Function parameters with types")
@@ -142,6 +316,8 @@ class FunctionInfo(BaseModel):
 class ScriptMetadata(BaseModel):
     """Metadata extracted from uploaded script."""
 
+    model_config = _FAST
+
     script_id: str = Field(description="Unique script identifier")
     filename: str = Field(description="Original filename")
     functions: list[FunctionInfo] = Field(description="Discovered functions")
@@ -149,7 +325,7 @@ class ScriptMetadata(BaseModel):
     dependencies: list[str] = Field(description="Package dependencies")
     file_size: int = Field(description="File size in bytes")
     upload_time: datetime = Field(
-        default_factory=datetime.now, description="Upload timestamp"
+        default_factory=_utc_now, description="Upload timestamp"
     )
     validation_status: str = Field(description="Validation result status")
     security_status: str = Field(description="Security scan status")
@@ -158,6 +334,8 @@ class ScriptMetadata(BaseModel):
 class ValidationResult(BaseModel):
     """Python file validation result."""
 
+    model_config = _FAST
+
     is_valid: bool = Field(description="Whether the file is valid")
     syntax_valid: bool = Field(description="Whether syntax is valid")
     security_safe: bool = Field(description="Whether file passes security checks")
@@ -171,11 +349,13 @@ class ValidationResult(BaseModel):
 class ScriptUploadResponse(BaseModel):
     """Response for script upload operation."""
 
+    model_config = _FAST
+
     script_id: str = Field(description="Generated script identifier")
     filename: str = Field(description="Original filename")
     size: int = Field(description="File size in bytes")
     upload_time: datetime = Field(
-        default_factory=datetime.now, description="Upload timestamp"
+        default_factory=_utc_now, description="Upload timestamp"
     )
     validation: ValidationResult = Field(description="Validation results")
     metadata: ScriptMetadata | None = Field(
@@ -186,13 +366,31 @@ class ScriptUploadResponse(BaseModel):
 class ScriptListResponse(BaseModel):
     """Response for listing uploaded scripts."""
 
+    model_config = _FAST
+
     scripts: list[ScriptMetadata] = Field(description="List of uploaded scripts")
     total: int = Field(description="Total number of scripts")
 
+    @classmethod
+    def from_trusted(
+        cls, scripts: list[ScriptMetadata], total: int | None = None
+    ) -> "ScriptListResponse":
+        """Assemble from already-validated ScriptMetadata objects.
+
+        Skips re-validating each item via model_construct; only for
+        internally produced data. ``total`` may differ from
+        ``len(scripts)`` when the list is paginated.
+        """
+        return cls.model_construct(
+            scripts=scripts, total=len(scripts) if total is None else total
+        )
+
 
 class ScriptSearchRequest(BaseModel):
     """Request for searching scripts."""
 
+    model_config = _FAST
+
     query: str = Field(description="Search query")
     search_in: list[str] = Field(
         default=["filename", "functions", "description"],
@@ -207,6 +405,8 @@ class ScriptSearchRequest(BaseModel):
 class EntryPointValidationResponse(BaseModel):
     """Response for script entry point validation."""
 
+    model_config = _FAST
+
     script_id: str = Field(description="Script identifier")
     has_entry_point: bool = Field(
         description="Whether script has if __name__ == '__main__' block"
@@ -221,7 +421,7 @@ class EntryPointValidationResponse(BaseModel):
         default_factory=dict, description="Additional validation details"
     )
     timestamp: datetime = Field(
-        default_factory=datetime.now, description="Validation timestamp"
+        default_factory=_utc_now, description="Validation timestamp"
     )
 
 
@@ -231,6 +431,8 @@ class EntryPointValidationResponse(BaseModel):
 class FunctionSelectionRequest(BaseModel):
     """Request model for selecting functions to expose as tools."""
 
+    model_config = _FAST
+
     selected_functions: list[str] = Field(
         description="List of function names to expose as tools"
     )
@@ -242,13 +444,15 @@ class FunctionSelectionRequest(BaseModel):
 class FunctionSelectionResponse(BaseModel):
     """Response model for function selection operations."""
 
+    model_config = _FAST
+
     script_id: str = Field(description="Script identifier")
     selected_functions: list[str] = Field(
         description="List of selected function names"
     )
     total_functions: int = Field(description="Total number of functions in script")
     timestamp: datetime = Field(
-        default_factory=datetime.now, description="Selection timestamp"
+        default_factory=_utc_now, description="Selection timestamp"
     )
 
 
@@ -258,6 +462,8 @@ class FunctionSelectionResponse(BaseModel):
 class ScriptParameter(BaseModel):
     """Model for a script-level parameter."""
 
+    model_config = _FAST
+
     name: str = Field(description="Parameter name")
     type: str = Field(description="Parameter type (str, int, float, bool)")
     description: str = Field(default="", description="Parameter description")
@@ -268,6 +474,8 @@ class ScriptParameter(BaseModel):
 class ScriptParametersRequest(BaseModel):
     """Request model for defining script-level parameters."""
 
+    model_config = _FAST
+
     parameters: list[ScriptParameter] = Field(
         description="List of script-level parameters"
     )
@@ -279,12 +487,14 @@ class ScriptParametersRequest(BaseModel):
 class ScriptParametersResponse(BaseModel):
     """Response model for script parameter operations."""
 
+    model_config = _FAST
+
     script_id: str = Field(description="Script identifier")
     parameters: list[ScriptParameter] = Field(
         description="List of configured parameters"
     )
     timestamp: datetime = Field(
-        default_factory=datetime.now, description="Configuration timestamp"
+        default_factory=_utc_now, description="Configuration timestamp"
     )
 
 
@@ -294,6 +504,8 @@ class ScriptParametersResponse(BaseModel):
 class CLIWrapperRequest(BaseModel):
     """Request model for generating CLI wrapper."""
 
+    model_config = _FAST
+
     wrapper_name: str = Field(description="Name for the CLI wrapper")
     description: str = Field(default="", description="Description of the wrapper")
     metadata: dict[str, Any] = Field(
@@ -304,12 +516,14 @@ class CLIWrapperRequest(BaseModel):
 class CLIWrapperResponse(BaseModel):
     """Response model for CLI wrapper generation."""
 
+    model_config = _FAST
+
     script_id: str = Field(description="Script identifier")
     wrapper_name: str = Field(description="Generated wrapper name")
     wrapper_path: str = Field(description="Path to generated wrapper file")
     metadata_path: str = Field(description="Path to wrapper metadata file")
     timestamp: datetime = Field(
-        default_factory=datetime.now, description="Generation timestamp"
+        default_factory=_utc_now, description="Generation timestamp"
     )
 
 
@@ -319,11 +533,20 @@ class CLIWrapperResponse(BaseModel):
 class SuccessResponse(BaseModel):
     """Generic success response model."""
 
+    model_config = _FAST
+
     success: bool = Field(default=True, description="Operation success status")
     message: str = Field(description="Success message")
     data: dict[str, Any] | None = Field(
         default=None, description="Additional response data"
     )
     timestamp: datetime = Field(
-        default_factory=datetime.now, description="Response timestamp"
+        default_factory=_utc_now, description="Response timestamp"
     )
+
+
+# ——— Precompiled bulk validators ———
+
+# TypeAdapters resolve their validator core once at import; batch
+# call-sites reuse them instead of paying per-call schema resolution.
+SCRIPT_LIST: TypeAdapter[list[ScriptMetadata]] = TypeAdapter(list[ScriptMetadata])
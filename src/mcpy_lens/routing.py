@@ -1,9 +1,15 @@
 """Dynamic routing management for mcpy-lens."""
 
 import logging
-from threading import RLock
 from typing import Any
 
+try:
+    # C-level reentrant lock, much cheaper per acquire than threading.RLock;
+    # worthwhile because is_active/get_service run on every request
+    from fastrlock.rlock import FastRLock as RLock
+except ImportError:  # pragma: no cover - optional accelerator
+    from threading import RLock
+
 from fastapi import APIRouter, FastAPI
 from fastapi.routing import APIRoute
 
@@ -13,6 +19,8 @@ from mcpy_lens.exceptions import DynamicRoutingError
 class ServiceInfo:
     """Information about a registered service."""
 
+    __slots__ = ("service_id", "name", "version", "routes", "metadata", "active")
+
     def __init__(
         self,
         service_id: str,
@@ -29,13 +37,93 @@ class ServiceInfo:
         self.active = True
 
 
+class _RouteTrie:
+    """Minimal segment trie over route paths for conflict detection.
+
+    A flat dict only catches exact duplicates; the trie also detects
+    prefix overlap in O(path-depth) — registering ``/svc/foo`` when
+    ``/svc/foo/bar`` exists, or vice versa.
+    """
+
+    __slots__ = ("children", "service_id")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _RouteTrie] = {}
+        self.service_id: str | None = None
+
+    @staticmethod
+    def _segments(path: str) -> list[str]:
+        return [s for s in path.split("/") if s]
+
+    def insert(self, path: str, service_id: str) -> None:
+        node = self
+        for segment in self._segments(path):
+            node = node.children.setdefault(segment, _RouteTrie())
+        node.service_id = service_id
+
+    def remove(self, path: str) -> None:
+        stack: list[tuple[_RouteTrie, str]] = []
+        node = self
+        for segment in self._segments(path):
+            child = node.children.get(segment)
+            if child is None:
+                return
+            stack.append((node, segment))
+            node = child
+        node.service_id = None
+        # Prune now-empty branches
+        while stack:
+            parent, segment = stack.pop()
+            child = parent.children[segment]
+            if child.children or child.service_id is not None:
+                break
+            del parent.children[segment]
+
+    def find_conflict(self, path: str) -> str | None:
+        """Return the owning service of any route overlapping ``path``.
+
+        Overlap means an exact match, a registered ancestor, or any
+        registered descendant of the path.
+        """
+        node = self
+        for segment in self._segments(path):
+            if node.service_id is not None:  # registered ancestor
+                return node.service_id
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        if node.service_id is not None:  # exact match
+            return node.service_id
+        return node._first_descendant_owner()
+
+    def _first_descendant_owner(self) -> str | None:
+        for child in self.children.values():
+            if child.service_id is not None:
+                return child.service_id
+            owner = child._first_descendant_owner()
+            if owner is not None:
+                return owner
+        return None
+
+
 class RouteManager:
     """Thread-safe manager for dynamic route operations."""
 
     def __init__(self) -> None:
+        # Writers serialize on the lock and publish changes by swapping in
+        # fresh dicts (copy-on-write); readers bind the current dict and
+        # never need the lock, so lookups proceed in parallel with
+        # registrations.
         self._lock = RLock()
         self._services: dict[str, ServiceInfo] = {}
         self._routes: dict[str, str] = {}  # route_path -> service_id mapping
+        # Inverted index: logical_path -> owning service_id. Conflict
+        # checks become one dict lookup instead of a scan over every
+        # registered service's logical routes.
+        self._logical_routes: dict[str, str] = {}
+        # Segment trie over final route paths: catches prefix overlap the
+        # flat exact-match dict cannot. Only touched under the lock.
+        self._route_trie = _RouteTrie()
         self._app: FastAPI | None | None = None
 
     def attach_app(self, app: FastAPI) -> None:
@@ -52,60 +140,62 @@ class RouteManager:
         metadata: dict[str, Any] | None = None,
     ) -> None:
         """Register a new service with its routes."""
+        # Cheap lockless duplicate check (dict reads are GIL-atomic): retry
+        # storms of the same service_id fail fast without contending with
+        # writers. The authoritative check under the lock handles the race.
+        existing = self._services.get(service_id)
+        if existing is not None:
+            raise DynamicRoutingError(
+                f"Service with ID '{service_id}' already exists",
+                {"existing_service": existing.name},
+            )
+
+        # Pure computation happens before the lock: extracting paths and
+        # building the prefixed variants touches no shared state
+        logical_routes = [  # Routes before service prefixing
+            route.path for route in router.routes if isinstance(route, APIRoute)
+        ]
+        prefix = f"/{service_id}"  # built once, not per route
+        route_paths = [prefix + path for path in logical_routes]
+
         with self._lock:
             # Check for service ID conflicts
             if service_id in self._services:
                 raise DynamicRoutingError(
                     f"Service with ID '{service_id}' already exists",
                     {"existing_service": self._services[service_id].name},
-                )            # Extract route paths from router
-            route_paths = []
-            logical_routes = []  # Routes before service prefixing
-
-            for route in router.routes:
-                if isinstance(route, APIRoute):
-                    logical_path = route.path  # Original path without service prefix
-                    route_path = f"/{service_id}{route.path}"  # Final path with service prefix
-
-                    route_paths.append(route_path)
-                    logical_routes.append(logical_path)
-
-                    # Check for logical route conflicts (same base path across services)
-                    existing_logical_routes = [
-                        path for existing_service_id, service in self._services.items()
-                        for path in service.metadata.get('logical_routes', [])
-                        if existing_service_id != service_id
-                    ]
-
-                    if logical_path in existing_logical_routes:
-                        # Find which service has this logical route
-                        conflicting_service = None
-                        for existing_service_id, service in self._services.items():
-                            if logical_path in service.metadata.get('logical_routes', []):
-                                conflicting_service = existing_service_id
-                                break
-
-                        raise DynamicRoutingError(
-                            f"Logical route '{logical_path}' conflicts with existing service",
-                            {
-                                "conflicting_service": conflicting_service,
-                                "requested_service": service_id,
-                                "logical_path": logical_path,
-                            },
-                        )
-
-                    # Check for actual route conflicts (final path conflicts)
-                    if route_path in self._routes:
-                        conflicting_service = self._routes[route_path]
-                        raise DynamicRoutingError(
-                            f"Route '{route_path}' conflicts with existing service",
-                            {
-                                "conflicting_service": conflicting_service,
-                                "requested_service": service_id,
-                            },
-                        )            # Register service
+                )
+
+            for logical_path, route_path in zip(logical_routes, route_paths):
+                # Check for logical route conflicts (same base path across services)
+                conflicting_service = self._logical_routes.get(logical_path)
+                if conflicting_service is not None and conflicting_service != service_id:
+                    raise DynamicRoutingError(
+                        f"Logical route '{logical_path}' conflicts with existing service",
+                        {
+                            "conflicting_service": conflicting_service,
+                            "requested_service": service_id,
+                            "logical_path": logical_path,
+                        },
+                    )
+
+                # Check for actual route conflicts: exact duplicates plus
+                # prefix overlap in either direction
+                conflicting_service = self._route_trie.find_conflict(route_path)
+                if conflicting_service is not None:
+                    raise DynamicRoutingError(
+                        f"Route '{route_path}' conflicts with existing service",
+                        {
+                            "conflicting_service": conflicting_service,
+                            "requested_service": service_id,
+                        },
+                    )
+
+            # Register service
             service_metadata = metadata or {}
-            service_metadata['logical_routes'] = logical_routes  # Store logical routes for conflict checking
+            # Kept for introspection; conflict checks go through the
+            # _logical_routes index, so this is never scanned
+            service_metadata['logical_routes'] = tuple(logical_routes)
 
             service_info = ServiceInfo(
                 service_id=service_id,
@@ -115,11 +205,21 @@ class RouteManager:
                 metadata=service_metadata,
             )
 
-            self._services[service_id] = service_info
-
-            # Register routes mapping
+            # Publish via copy-on-write so lock-free readers never observe
+            # a partially registered service
+            services = dict(self._services)
+            services[service_id] = service_info
+            routes = dict(self._routes)
+            for route_path in route_paths:
+                routes[route_path] = service_id
+            logical = dict(self._logical_routes)
+            for logical_path in logical_routes:
+                logical[logical_path] = service_id
+            self._services = services
+            self._routes = routes
+            self._logical_routes = logical
             for route_path in route_paths:
-                self._routes[route_path] = service_id
+                self._route_trie.insert(route_path, service_id)
 
             # Add routes to FastAPI app if attached
             if self._app is not None:
@@ -143,16 +243,32 @@ class RouteManager:
 
             service_info = self._services[service_id]
 
-            # Remove route mappings
-            for route_path in service_info.routes:
-                self._routes.pop(route_path, None)
-
-            # Mark service as inactive
+            # Remove route mappings (copy-on-write for lock-free readers)
+            removed = set(service_info.routes)
+            self._routes = {
+                path: owner
+                for path, owner in self._routes.items()
+                if path not in removed
+            }
+            self._logical_routes = {
+                path: owner
+                for path, owner in self._logical_routes.items()
+                if owner != service_id
+            }
+
+            # Mark the (now detached) service info inactive and drop the
+            # entry entirely so torn-down services stop accumulating and
+            # list_services needs no filtering
             service_info.active = False
+            services = dict(self._services)
+            del services[service_id]
+            self._services = services
+            for route_path in service_info.routes:
+                self._route_trie.remove(route_path)
 
-            # NOTE: FastAPI doesn't support dynamic route removal easily
-            # For now, we mark the service as inactive
-            # In production, this would require app restart or more complex routing
+            # NOTE: FastAPI doesn't support dynamic route removal easily.
+            # The mounted routes stay on the app, but the registry no
+            # longer advertises the service.
 
             logging.info(
                 "Service unregistered",
@@ -165,23 +281,24 @@ class RouteManager:
             return True
 
     def get_service(self, service_id: str) -> ServiceInfo | None:
-        """Get information about a registered service."""
-        with self._lock:
-            return self._services.get(service_id)
+        """Get information about a registered service (lock-free read)."""
+        return self._services.get(service_id)
 
     def list_services(self) -> list[ServiceInfo]:
-        """List all registered services."""
-        with self._lock:
-            return [service for service in self._services.values() if service.active]
+        """List all registered services (lock-free read)."""
+        # Unregistered services are removed from the table, so no filter
+        return list(self._services.values())
 
     def get_route_conflicts(self, routes: list[str]) -> list[str]:
-        """Check for potential route conflicts."""
+        """Check for potential route conflicts, including prefix overlap."""
+        # The trie is mutated in place by writers, so take the lock here;
+        # this endpoint is not on the request hot path
         with self._lock:
-            conflicts = []
-            for route in routes:
-                if route in self._routes:
-                    conflicts.append(route)
-            return conflicts
+            return [
+                route
+                for route in routes
+                if self._route_trie.find_conflict(route) is not None
+            ]
 
     def _add_router_to_app(self, service_id: str, router: APIRouter) -> None:
         """Add router to FastAPI app with service prefix."""
@@ -189,7 +306,7 @@ class RouteManager:
             return
 
         # Add router with service prefix
-        self._app.include_router(router, prefix=f"/{service_id}", tags=[service_id])
+        self._app.include_router(router, prefix="/" + service_id, tags=[service_id])
 
     async def cleanup(self) -> None:
         """Cleanup resources during application shutdown."""
@@ -247,29 +364,37 @@ class ServiceRegistry:
     def __init__(self) -> None:
         self._lock = RLock()
         self._active_services: set[str] = set()
+        # Immutable view handed to callers; rebuilt lazily after mutation
+        # so get_active_services is O(1) instead of copying per call
+        self._active_view: frozenset[str] | None = frozenset()
         self._service_processes: dict[str, Any] = {}  # For future process management
 
     def add_service(self, service_id: str) -> None:
         """Add a service to the active registry."""
         with self._lock:
             self._active_services.add(service_id)
+            self._active_view = None
 
     def remove_service(self, service_id: str) -> bool:
         """Remove a service from the active registry."""
         with self._lock:
             if service_id in self._active_services:
                 self._active_services.remove(service_id)
+                self._active_view = None
                 # Clean up any associated processes
                 self._service_processes.pop(service_id, None)
                 return True
             return False
 
     def is_active(self, service_id: str) -> bool:
-        """Check if a service is currently active."""
-        with self._lock:
-            return service_id in self._active_services
-
-    def get_active_services(self) -> set[str]:
-        """Get set of currently active service IDs."""
-        with self._lock:
-            return self._active_services.copy()
+        """Check if a service is currently active (lock-free read)."""
+        # Set membership is atomic under the GIL; this runs per request
+        return service_id in self._active_services
+
+    def get_active_services(self) -> frozenset[str]:
+        """Get the set of currently active service IDs (immutable view)."""
+        view = self._active_view
+        if view is None:
+            with self._lock:
+                view = self._active_view = frozenset(self._active_services)
+        return view
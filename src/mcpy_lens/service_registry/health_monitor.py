@@ -7,9 +7,12 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 import subprocess
 
+import orjson
+
 from .models import ServiceConfig, ServiceStatus, HealthCheckResult
 from .service_registry import ServiceRegistry
 
@@ -24,6 +27,20 @@ class HealthMonitor:
         self._health_results: Dict[str, HealthCheckResult] = {}
         self._monitoring_task: Optional[asyncio.Task] = None
         self._monitoring_interval = 60  # Check every minute
+        self._check_semaphore = asyncio.Semaphore(32)  # Cap concurrent checks
+        # Long-lived wrapper processes, one per service: spawning a fresh
+        # interpreter per check costs 50-200ms, so checks reuse a running
+        # wrapper and talk JSON-RPC over its pipes. Per-service locks keep
+        # concurrent checks from interleaving on the same pipe.
+        self._wrapper_procs: Dict[str, asyncio.subprocess.Process] = {}
+        self._proc_locks: Dict[str, asyncio.Lock] = {}
+        # Resolved wrapper paths by script_id. Wrappers don't move once
+        # written, so a hit skips the stat() calls; misses are not cached
+        # so a wrapper generated after registration is still picked up.
+        self._wrapper_path_cache: Dict[str, Path] = {}
+        # Parsed metadata keyed by path, tagged with st_mtime_ns: unchanged
+        # files cost one stat per check instead of a read + JSON parse
+        self._metadata_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
         self._started = False
     
     async def start(self) -> None:
@@ -47,7 +64,18 @@ class HealthMonitor:
                 await self._monitoring_task
             except asyncio.CancelledError:
                 pass
-        
+
+        # Terminate cached wrapper processes
+        for service_id, process in list(self._wrapper_procs.items()):
+            if process.returncode is None:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    process.kill()
+        self._wrapper_procs.clear()
+        self._proc_locks.clear()
+
         self._started = False
     
     async def check_service_health(self, service_id: str) -> HealthCheckResult:
@@ -62,16 +90,18 @@ class HealthMonitor:
                 error_message="Service not found"
             )
         
-        start_time = time.time()
-        
+        # perf_counter: lower overhead and better resolution than
+        # time.time() for short durations
+        start_time = time.perf_counter()
+
         try:
             # Perform functional health check
             if service_config.hosting_mode.value == "stdio":
                 result = await self._check_stdio_service(service_config)
             else:
                 result = await self._check_sse_service(service_config)
-            
-            response_time = (time.time() - start_time) * 1000
+
+            response_time = (time.perf_counter() - start_time) * 1000
             
             health_result = HealthCheckResult(
                 service_id=service_id,
@@ -92,7 +122,7 @@ class HealthMonitor:
             return health_result
             
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter() - start_time) * 1000
             error_message = str(e)
             
             health_result = HealthCheckResult(
@@ -122,6 +152,9 @@ class HealthMonitor:
                 "error": f"Wrapper not found: {wrapper_path}"
             }
         
+        service_id = service_config.service_id
+        lock = self._proc_locks.setdefault(service_id, asyncio.Lock())
+
         try:
             # Test basic functionality by calling listtools
             test_request = {
@@ -129,32 +162,61 @@ class HealthMonitor:
                 "method": "listtools",
                 "id": "health_check"
             }
-            
-            # Execute wrapper with test request
-            process = await asyncio.create_subprocess_exec(
-                "python", str(wrapper_path),
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=wrapper_path.parent
-            )
-            
-            # Send test request
-            request_json = json.dumps(test_request) + "\n"
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(request_json.encode()),
-                timeout=10.0
-            )
-            
-            if process.returncode != 0:
+            request_bytes = orjson.dumps(test_request) + b"\n"
+
+            async with lock:
+                # Reuse the cached wrapper process; respawn only if it
+                # exited since the last check
+                process = self._wrapper_procs.get(service_id)
+                if process is None or process.returncode is not None:
+                    process = await asyncio.create_subprocess_exec(
+                        "python", str(wrapper_path),
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        cwd=wrapper_path.parent
+                    )
+                    self._wrapper_procs[service_id] = process
+
+                try:
+                    process.stdin.write(request_bytes)
+                    await process.stdin.drain()
+                    line = await asyncio.wait_for(
+                        process.stdout.readline(),
+                        timeout=10.0
+                    )
+                except asyncio.CancelledError:
+                    # Cycle budget expired or monitor stopping: reclaim the
+                    # process immediately instead of leaving it to GC
+                    self._wrapper_procs.pop(service_id, None)
+                    if process.returncode is None:
+                        process.kill()
+                    raise
+                except (asyncio.TimeoutError, ConnectionResetError, BrokenPipeError) as e:
+                    # Drop the broken process so the next check respawns
+                    self._wrapper_procs.pop(service_id, None)
+                    if process.returncode is None:
+                        process.kill()
+                    if isinstance(e, asyncio.TimeoutError):
+                        return {
+                            "status": ServiceStatus.ERROR,
+                            "error": "Health check timed out"
+                        }
+                    return {
+                        "status": ServiceStatus.ERROR,
+                        "error": f"Wrapper process failed: {e}"
+                    }
+
+            if not line:
+                self._wrapper_procs.pop(service_id, None)
                 return {
                     "status": ServiceStatus.ERROR,
-                    "error": f"Wrapper process failed: {stderr.decode()}"
+                    "error": "Wrapper process closed its output"
                 }
-            
+
             # Parse response
             try:
-                response = json.loads(stdout.decode().strip())
+                response = orjson.loads(line)
                 if "result" in response:
                     return {
                         "status": ServiceStatus.ACTIVE,
@@ -173,12 +235,7 @@ class HealthMonitor:
                     "status": ServiceStatus.ERROR,
                     "error": f"Invalid JSON response: {e}"
                 }
-                
-        except asyncio.TimeoutError:
-            return {
-                "status": ServiceStatus.ERROR,
-                "error": "Health check timed out"
-            }
+
         except Exception as e:
             return {
                 "status": ServiceStatus.ERROR,
@@ -198,17 +255,23 @@ class HealthMonitor:
         
         # Check if metadata file exists
         metadata_path = wrapper_path.parent / f"{service_config.script_id}_metadata.json"
-        if not metadata_path.exists():
+        try:
+            stat = metadata_path.stat()
+        except OSError:
             return {
                 "status": ServiceStatus.ERROR,
                 "error": f"Metadata file not found: {metadata_path}"
             }
-        
+
         try:
-            # Validate metadata
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            
+            # Validate metadata, reusing the parse when the file is unchanged
+            cached = self._metadata_cache.get(metadata_path)
+            if cached is not None and cached[0] == stat.st_mtime_ns:
+                metadata = cached[1]
+            else:
+                metadata = orjson.loads(metadata_path.read_bytes())
+                self._metadata_cache[metadata_path] = (stat.st_mtime_ns, metadata)
+
             if "tools" not in metadata:
                 return {
                     "status": ServiceStatus.ERROR,
@@ -231,36 +294,61 @@ class HealthMonitor:
             }
     
     def _get_wrapper_path(self, service_config: ServiceConfig) -> Optional[Path]:
-        """Get wrapper path for a service."""
-        wrapper_dir = self.wrappers_dir / service_config.script_id
-        if wrapper_dir.exists():
-            wrapper_script = wrapper_dir / f"{service_config.script_id}_wrapper.py"
-            if wrapper_script.exists():
-                return wrapper_script
+        """Get wrapper path for a service (memoized on success)."""
+        script_id = service_config.script_id
+        cached = self._wrapper_path_cache.get(script_id)
+        if cached is not None:
+            return cached
+
+        wrapper_script = self.wrappers_dir / script_id / f"{script_id}_wrapper.py"
+        if wrapper_script.exists():
+            self._wrapper_path_cache[script_id] = wrapper_script
+            return wrapper_script
         return None
     
     def get_health_result(self, service_id: str) -> Optional[HealthCheckResult]:
         """Get latest health check result for a service."""
         return self._health_results.get(service_id)
     
-    def get_all_health_results(self) -> Dict[str, HealthCheckResult]:
-        """Get all health check results."""
-        return self._health_results.copy()
+    def get_all_health_results(self) -> Mapping[str, HealthCheckResult]:
+        """Get all health check results (read-only view, no copy)."""
+        return MappingProxyType(self._health_results)
     
+    async def _check_with_limit(self, service_id: str) -> HealthCheckResult:
+        """Run one health check under the concurrency semaphore."""
+        async with self._check_semaphore:
+            return await self.check_service_health(service_id)
+
     async def _monitoring_loop(self) -> None:
         """Background monitoring loop."""
         while True:
             try:
                 # Get all active services
                 active_services = self.service_registry.get_active_services()
-                
-                # Check health of each service
-                for service_config in active_services:
-                    try:
-                        await self.check_service_health(service_config.service_id)
-                    except Exception as e:
-                        self.logger.error(f"Error checking health for service {service_config.service_id}: {e}")
-                
+
+                # Check all services concurrently: a cycle is bounded by
+                # the slowest check, not the sum, while the semaphore caps
+                # the number of wrapper subprocesses spawned at once. The
+                # whole cycle gets a budget below the monitoring interval
+                # so a stuck service cannot delay the next cycle.
+                try:
+                    async with asyncio.timeout(self._monitoring_interval * 0.8):
+                        results = await asyncio.gather(
+                            *(
+                                self._check_with_limit(service_config.service_id)
+                                for service_config in active_services
+                            ),
+                            return_exceptions=True,
+                        )
+                except TimeoutError:
+                    self.logger.error("Health check cycle exceeded its time budget")
+                    results = []
+                for service_config, result in zip(active_services, results):
+                    if isinstance(result, Exception):
+                        self.logger.error(
+                            f"Error checking health for service {service_config.service_id}: {result}"
+                        )
+
                 # Wait for next check
                 await asyncio.sleep(self._monitoring_interval)
                 
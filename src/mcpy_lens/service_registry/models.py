@@ -8,6 +8,8 @@ from enum import Enum
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+import orjson
+
 
 class ServiceStatus(str, Enum):
     """Service status enumeration."""
@@ -28,21 +30,28 @@ class HostingMode(str, Enum):
     SSE = "sse"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolInfo:
     """Information about a tool exposed by a service."""
     name: str
     description: str
     parameters: Dict[str, Any]
     return_type: str
-    
+    # Memoized dict form; tool definitions never change after creation
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, repr=False, compare=False
+    )
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": self.parameters,
-            "return_type": self.return_type
-        }
+        cached = self._cached_dict
+        if cached is None:
+            cached = self._cached_dict = {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.parameters,
+                "return_type": self.return_type
+            }
+        return cached
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ToolInfo":
@@ -54,7 +63,7 @@ class ToolInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceConfig:
     """Service configuration model."""
     service_id: str
@@ -66,14 +75,25 @@ class ServiceConfig:
     tools: List[ToolInfo]
     routes: List[str]
     status: ServiceStatus = ServiceStatus.INACTIVE
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    # Timestamps are epoch floats: time.time() is much cheaper than
+    # datetime.now() and update_status runs on every status change.
+    # Conversion to ISO happens only at serialization time.
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
     config: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    
+    # Memoized dict form, rebuilt lazily after update_status(); service
+    # config rarely changes but is serialized on every list/get request
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, repr=False, compare=False
+    )
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
+        """Convert to dictionary for JSON serialization (memoized)."""
+        cached = self._cached_dict
+        if cached is not None:
+            return cached
+        self._cached_dict = cached = {
             "service_id": self.service_id,
             "name": self.name,
             "description": self.description,
@@ -83,12 +103,13 @@ class ServiceConfig:
             "tools": [tool.to_dict() for tool in self.tools],
             "routes": self.routes,
             "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": datetime.fromtimestamp(self.created_at).isoformat(),
+            "updated_at": datetime.fromtimestamp(self.updated_at).isoformat(),
             "config": self.config,
             "metadata": self.metadata
         }
-    
+        return cached
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ServiceConfig":
         """Create from dictionary."""
@@ -102,8 +123,8 @@ class ServiceConfig:
             tools=[ToolInfo.from_dict(tool) for tool in data["tools"]],
             routes=data["routes"],
             status=ServiceStatus(data["status"]),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
+            created_at=datetime.fromisoformat(data["created_at"]).timestamp(),
+            updated_at=datetime.fromisoformat(data["updated_at"]).timestamp(),
             config=data.get("config", {}),
             metadata=data.get("metadata", {})
         )
@@ -111,15 +132,20 @@ class ServiceConfig:
     def update_status(self, status: ServiceStatus) -> None:
         """Update service status and timestamp."""
         self.status = status
-        self.updated_at = datetime.now()
+        self.updated_at = time.time()
+        self._cached_dict = None  # invalidate memoized dict form
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes with orjson, same shape as to_dict()."""
+        return orjson.dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a service health check."""
     service_id: str
     status: ServiceStatus
-    timestamp: datetime
+    timestamp: float  # epoch seconds; ISO-formatted only in to_dict()
     response_time_ms: float
     details: Dict[str, Any] = field(default_factory=dict)
     error_message: Optional[str] = None
@@ -129,7 +155,7 @@ class HealthCheckResult:
         return {
             "service_id": self.service_id,
             "status": self.status.value,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
             "response_time_ms": self.response_time_ms,
             "details": self.details,
             "error_message": self.error_message
@@ -141,14 +167,18 @@ class HealthCheckResult:
         return cls(
             service_id=data["service_id"],
             status=ServiceStatus(data["status"]),
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            timestamp=datetime.fromisoformat(data["timestamp"]).timestamp(),
             response_time_ms=data["response_time_ms"],
             details=data.get("details", {}),
             error_message=data.get("error_message")
         )
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes with orjson, same shape as to_dict()."""
+        return orjson.dumps(self.to_dict())
+
 
-@dataclass
+@dataclass(slots=True)
 class ServiceRegistrationRequest:
     """Request model for service registration."""
     name: str
@@ -2,14 +2,31 @@
 FastAPI routes for service registry management.
 """
 
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from .service_manager import ServiceManager
-from .models import ServiceConfig, ServiceStatus, ServiceRegistrationRequest, ToolInfo
+from .models import (
+    HostingMode,
+    ServiceConfig,
+    ServiceRegistrationRequest,
+    ServiceStatus,
+    ServiceType,
+    ToolInfo,
+)
+
+# Module-level logger so error paths don't re-resolve the root logger
+logger = logging.getLogger(__name__)
+
+# Above this many services, list assembly moves to a worker thread so a
+# huge registry cannot stall the event loop; below it, the thread hop
+# would cost more than the loop itself
+_LIST_OFFLOAD_THRESHOLD = 100
 
 
 # Request/Response models
@@ -23,13 +40,32 @@ class ToolInfoModel(BaseModel):
 class ServiceRegistrationModel(BaseModel):
     name: str
     description: str
-    service_type: str
-    hosting_mode: str
+    # Validated straight into the internal enums, so the conversion to
+    # ServiceRegistrationRequest below is plain construction with no
+    # second validation pass
+    service_type: ServiceType
+    hosting_mode: HostingMode
     script_id: str
     tools: List[ToolInfoModel]
     config: Dict[str, Any] = {}
     metadata: Dict[str, Any] = {}
 
+    def to_request(self) -> ServiceRegistrationRequest:
+        """Convert the validated payload to the internal request dataclass."""
+        return ServiceRegistrationRequest(
+            name=self.name,
+            description=self.description,
+            service_type=self.service_type,
+            hosting_mode=self.hosting_mode,
+            script_id=self.script_id,
+            tools=[
+                ToolInfo(tool.name, tool.description, tool.parameters, tool.return_type)
+                for tool in self.tools
+            ],
+            config=self.config,
+            metadata=self.metadata,
+        )
+
 
 class ServiceConfigResponse(BaseModel):
     service_id: str
@@ -45,6 +81,7 @@ class ServiceConfigResponse(BaseModel):
     updated_at: str
     config: Dict[str, Any]
     metadata: Dict[str, Any]
+    tool_count: int = 0
 
 
 class ServiceListResponse(BaseModel):
@@ -66,6 +103,31 @@ class HealthCheckResponse(BaseModel):
     error_message: Optional[str] = None
 
 
+def _service_payload(service_config: ServiceConfig) -> Dict[str, Any]:
+    """Build the response-shaped dict for a service config.
+
+    Shallow-copies the memoized ``to_dict()`` form (which must never be
+    mutated) and renames the persisted ``type`` key to the
+    ``service_type`` field the response schema declares.
+    """
+    data = dict(service_config.to_dict())
+    data["service_type"] = data.pop("type")
+    data["tool_count"] = len(service_config.tools)
+    return data
+
+
+def _service_to_response(service_config: ServiceConfig) -> ServiceConfigResponse:
+    """Build a response model from internal config without re-validation.
+
+    The registry already holds validated data, so ``model_construct``
+    skips Pydantic's per-field validators — the dominant cost when
+    listing many services.
+    """
+    data = _service_payload(service_config)
+    data["tools"] = [ToolInfoModel.model_construct(**tool) for tool in data["tools"]]
+    return ServiceConfigResponse.model_construct(**data)
+
+
 # Global service manager instance
 _service_manager: Optional[ServiceManager] = None
 
@@ -78,14 +140,30 @@ async def get_service_manager() -> ServiceManager:
     return _service_manager
 
 
+def _require_service_manager() -> ServiceManager:
+    """Fetch the global service manager without going through DI.
+
+    The hot read endpoints call this directly instead of declaring
+    ``Depends(get_service_manager)``, skipping FastAPI's dependency
+    resolution machinery on every request.
+    """
+    if _service_manager is None:
+        raise HTTPException(status_code=500, detail="Service manager not initialized")
+    return _service_manager
+
+
 def set_service_manager(service_manager: ServiceManager) -> None:
     """Set the global service manager instance."""
     global _service_manager
     _service_manager = service_manager
 
 
-# Create router
-service_registry_router = APIRouter(prefix="/api/v1/services", tags=["service-registry"])
+# Create router; responses serialize through orjson instead of stdlib json
+service_registry_router = APIRouter(
+    prefix="/api/v1/services",
+    tags=["service-registry"],
+    default_response_class=ORJSONResponse,
+)
 
 
 @service_registry_router.post("/register", response_model=ServiceConfigResponse)
@@ -95,90 +173,72 @@ async def register_service(
 ):
     """Register a new service."""
     try:
-        # Convert to internal model
-        tools = [
-            ToolInfo(
-                name=tool.name,
-                description=tool.description,
-                parameters=tool.parameters,
-                return_type=tool.return_type
-            )
-            for tool in request.tools
-        ]
-        
-        registration_request = ServiceRegistrationRequest(
-            name=request.name,
-            description=request.description,
-            service_type=request.service_type,
-            hosting_mode=request.hosting_mode,
-            script_id=request.script_id,
-            tools=tools,
-            config=request.config,
-            metadata=request.metadata
-        )
-        
-        service_config = await service_manager.register_service(registration_request)
+        service_config = await service_manager.register_service(request.to_request())
         
         # Convert to response model
-        return ServiceConfigResponse(**service_config.to_dict())
+        return _service_to_response(service_config)
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logging.error(f"Error registering service: {e}")
+        logger.error("Error registering service: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to register service: {str(e)}")
 
 
 @service_registry_router.get("/", response_model=ServiceListResponse)
 async def list_services(
-    status: Optional[str] = Query(None, description="Filter by service status"),
-    service_manager: ServiceManager = Depends(get_service_manager)
+    # Typed as the enum so Pydantic validates the query value at C speed
+    # and invalid values get a 422 without a hand-rolled try/except
+    status: Optional[ServiceStatus] = Query(None, description="Filter by service status"),
 ):
     """List all services with optional status filter."""
     try:
-        status_filter = None
-        if status:
-            try:
-                status_filter = ServiceStatus(status)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
-        
-        services = service_manager.list_services(status_filter)
-        
-        service_responses = [
-            ServiceConfigResponse(**service.to_dict())
-            for service in services
-        ]
-        
-        return ServiceListResponse(
-            services=service_responses,
-            total=len(service_responses)
-        )
+        service_manager = _require_service_manager()
+        services = service_manager.list_services(status)
+
+        # Skip the Pydantic response layer entirely: each service's dict
+        # form is memoized, so the whole list path is "orjson-serialize a
+        # list of pre-built dicts". tool_count stays precomputed so list
+        # consumers can render counts without measuring the tools array.
+        def _assemble() -> List[Dict[str, Any]]:
+            # _service_payload renames the persisted "type" key to the
+            # "service_type" field promised by ServiceListResponse
+            return [_service_payload(service) for service in services]
+
+        if len(services) > _LIST_OFFLOAD_THRESHOLD:
+            service_dicts = await asyncio.to_thread(_assemble)
+        else:
+            service_dicts = _assemble()
+
+        return ORJSONResponse({
+            "services": service_dicts,
+            "total": len(services),
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error listing services: {e}")
+        logger.error("Error listing services: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to list services: {str(e)}")
 
 
 @service_registry_router.get("/{service_id}", response_model=ServiceConfigResponse)
 async def get_service(
     service_id: str,
-    service_manager: ServiceManager = Depends(get_service_manager)
 ):
     """Get service configuration by ID."""
     try:
+        service_manager = _require_service_manager()
         service_config = service_manager.get_service(service_id)
         if not service_config:
             raise HTTPException(status_code=404, detail=f"Service {service_id} not found")
         
-        return ServiceConfigResponse(**service_config.to_dict())
+        return _service_to_response(service_config)
         
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error getting service {service_id}: {e}")
+        logger.error("Error getting service %s: %s", service_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to get service: {str(e)}")
 
 
@@ -198,7 +258,7 @@ async def activate_service(
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error activating service {service_id}: {e}")
+        logger.error("Error activating service %s: %s", service_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to activate service: {str(e)}")
 
 
@@ -218,7 +278,7 @@ async def deactivate_service(
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error deactivating service {service_id}: {e}")
+        logger.error("Error deactivating service %s: %s", service_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to deactivate service: {str(e)}")
 
 
@@ -238,7 +298,7 @@ async def unregister_service(
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error unregistering service {service_id}: {e}")
+        logger.error("Error unregistering service %s: %s", service_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to unregister service: {str(e)}")
 
 
@@ -254,17 +314,17 @@ async def check_service_health(
         return HealthCheckResponse(**health_result.to_dict())
         
     except Exception as e:
-        logging.error(f"Error checking health for service {service_id}: {e}")
+        logger.error("Error checking health for service %s: %s", service_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to check service health: {str(e)}")
 
 
 @service_registry_router.get("/{service_id}/tools")
 async def get_service_tools(
     service_id: str,
-    service_manager: ServiceManager = Depends(get_service_manager)
 ):
     """Get tools exposed by a service."""
     try:
+        service_manager = _require_service_manager()
         service_config = service_manager.get_service(service_id)
         if not service_config:
             raise HTTPException(status_code=404, detail=f"Service {service_id} not found")
@@ -280,7 +340,7 @@ async def get_service_tools(
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error getting tools for service {service_id}: {e}")
+        logger.error("Error getting tools for service %s: %s", service_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to get service tools: {str(e)}")
 
 
@@ -294,7 +354,7 @@ async def get_service_stats(
         return ServiceStatsResponse(**stats)
         
     except Exception as e:
-        logging.error(f"Error getting service stats: {e}")
+        logger.error("Error getting service stats: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get service stats: {str(e)}")
 
 
@@ -9,7 +9,14 @@ from typing import Dict, List, Optional, Any
 from mcpy_lens.routing import RouteManager
 from .service_registry import ServiceRegistry
 from .health_monitor import HealthMonitor
-from .models import ServiceConfig, ServiceStatus, ServiceRegistrationRequest, ToolInfo
+from .models import (
+    HostingMode,
+    ServiceConfig,
+    ServiceRegistrationRequest,
+    ServiceStatus,
+    ServiceType,
+    ToolInfo,
+)
 
 
 class ServiceManager:
@@ -33,7 +40,14 @@ class ServiceManager:
             return
         
         self.logger.info("Starting service manager")
-        
+
+        # Load persisted services (reads happen in parallel off the loop)
+        await self.service_registry.initialize()
+
+        # Start the debounced persistence flusher before health checks
+        # can generate status transitions
+        await self.service_registry.start_persistence()
+
         # Start health monitoring
         await self.health_monitor.start()
         
@@ -52,19 +66,22 @@ class ServiceManager:
         
         # Stop health monitoring
         await self.health_monitor.stop()
-        
+
+        # Flush any pending status writes before shutdown
+        await self.service_registry.stop_persistence()
+
         self._started = False
         self.logger.info("Service manager stopped")
     
     async def _register_existing_services(self) -> None:
         """Register existing active services with the route manager."""
-        active_services = self.service_registry.get_active_services()
-        
-        for service_config in active_services:
+        # Iterate-once consumer: the generator skips the list copy, and
+        # its ID snapshot tolerates the status flip in the error branch
+        for service_config in self.service_registry.iter_services(ServiceStatus.ACTIVE):
             try:
                 await self._register_service_routes(service_config)
             except Exception as e:
-                self.logger.error(f"Error registering routes for service {service_config.service_id}: {e}")
+                self.logger.error("Error registering routes for service %s: %s", service_config.service_id, e)
                 # Mark service as error if route registration fails
                 await self.service_registry.update_service_status(service_config.service_id, ServiceStatus.ERROR)
     
@@ -91,8 +108,8 @@ class ServiceManager:
             request = ServiceRegistrationRequest(
                 name=wrapper_metadata.get("name", f"service_{script_id}"),
                 description=wrapper_metadata.get("description", f"Auto-generated service for script {script_id}"),
-                service_type=wrapper_metadata.get("type", "function"),
-                hosting_mode=wrapper_metadata.get("hosting_mode", "sse"),
+                service_type=ServiceType(wrapper_metadata.get("type", "function")),
+                hosting_mode=HostingMode(wrapper_metadata.get("hosting_mode", "sse")),
                 script_id=script_id,
                 tools=tools,
                 metadata={
@@ -108,17 +125,17 @@ class ServiceManager:
             if auto_activate:
                 await self.activate_service(service_config.service_id)
             
-            self.logger.info(f"Auto-registered service {service_config.service_id} from wrapper")
+            self.logger.info("Auto-registered service %s from wrapper", service_config.service_id)
             return service_config
             
         except Exception as e:
-            self.logger.error(f"Error auto-registering service from wrapper: {e}")
+            self.logger.error("Error auto-registering service from wrapper: %s", e)
             raise
     
     async def register_service(self, request: ServiceRegistrationRequest) -> ServiceConfig:
         """Register a new service manually."""
         service_config = await self.service_registry.register_service(request)
-        self.logger.info(f"Manually registered service {service_config.service_id}")
+        self.logger.info("Manually registered service %s", service_config.service_id)
         return service_config
     
     async def activate_service(self, service_id: str) -> bool:
@@ -134,11 +151,11 @@ class ServiceManager:
             # Update service status
             await self.service_registry.update_service_status(service_id, ServiceStatus.ACTIVE)
             
-            self.logger.info(f"Activated service {service_id}")
+            self.logger.info("Activated service %s", service_id)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error activating service {service_id}: {e}")
+            self.logger.error("Error activating service %s: %s", service_id, e)
             await self.service_registry.update_service_status(service_id, ServiceStatus.ERROR)
             return False
     
@@ -155,11 +172,11 @@ class ServiceManager:
             # Update service status
             await self.service_registry.update_service_status(service_id, ServiceStatus.INACTIVE)
             
-            self.logger.info(f"Deactivated service {service_id}")
+            self.logger.info("Deactivated service %s", service_id)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error deactivating service {service_id}: {e}")
+            self.logger.error("Error deactivating service %s: %s", service_id, e)
             return False
     
     async def unregister_service(self, service_id: str) -> bool:
@@ -171,7 +188,7 @@ class ServiceManager:
         result = await self.service_registry.unregister_service(service_id)
         
         if result:
-            self.logger.info(f"Unregistered service {service_id}")
+            self.logger.info("Unregistered service %s", service_id)
         
         return result
     
@@ -185,16 +202,19 @@ class ServiceManager:
         from fastapi import APIRouter
         router = APIRouter()
         
-        # Register with route manager (this marks routes as taken)
+        # Register with route manager (this marks routes as taken).
+        # to_dict() is memoized on the config, so reusing its tools list
+        # avoids walking every tool again per activation.
+        cached_dict = service_config.to_dict()
         self.route_manager.register_service(
             service_id=service_config.service_id,
             name=service_config.name,
             version="1.0.0",
             router=router,
             metadata={
-                "service_type": service_config.service_type.value,
-                "hosting_mode": service_config.hosting_mode.value,
-                "tools": [tool.to_dict() for tool in service_config.tools],
+                "service_type": cached_dict["type"],
+                "hosting_mode": cached_dict["hosting_mode"],
+                "tools": cached_dict["tools"],
                 "routes": service_config.routes
             }
         )
@@ -2,15 +2,35 @@
 Service registry for managing MCP services.
 """
 
-import json
+import asyncio
 import logging
+import os
 import uuid
+from collections import Counter, defaultdict
 from pathlib import Path
-from threading import RLock
-from typing import Dict, List, Optional, Any
-import aiofiles
+from typing import Any, Dict, Iterator, List, Optional
 
-from .models import ServiceConfig, ServiceStatus, ServiceRegistrationRequest
+import orjson
+
+from .models import HostingMode, ServiceConfig, ServiceStatus, ServiceRegistrationRequest
+
+
+# Route templates built once; _generate_routes runs on every register
+_BASE_ROUTE_TEMPLATES = (
+    "/api/v1/services/{}",
+    "/api/v1/services/{}/health",
+    "/api/v1/services/{}/tools",
+)
+_SSE_ROUTE_TEMPLATES = (
+    "/api/v1/mcp/{}",
+    "/api/v1/stream/{}",
+)
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read a file's contents; runs in a worker thread during loading."""
+    with open(path, "rb") as f:
+        return f.read()
 
 
 class ServiceRegistry:
@@ -19,67 +39,154 @@ class ServiceRegistry:
     def __init__(self, services_dir: Path):
         self.services_dir = services_dir
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._lock = RLock()
+        # The registry lives on the event loop, so writers coordinate via
+        # asyncio.Lock; pure reads skip locking entirely (dict reads are
+        # GIL-atomic and every mutation happens on the loop thread)
+        self._lock = asyncio.Lock()
         self._services: Dict[str, ServiceConfig] = {}
         self._service_index: Dict[str, str] = {}  # name -> service_id mapping
+        # Status updates only mark the service dirty; a background task
+        # flushes dirty services periodically so bursty health-check
+        # transitions coalesce into one write per service per interval
+        self._dirty: set = set()
+        self._flush_interval = 2.0  # seconds
+        self._flush_task: Optional["asyncio.Task"] = None
+        # Incremental counters so get_service_stats is O(1) instead of
+        # scanning every service; maintained on register/unregister and
+        # status changes
+        self._status_counts: Counter = Counter()
+        self._type_counts: Counter = Counter()
+        self._mode_counts: Counter = Counter()
+        # Secondary index: status -> service IDs, so filtered listings
+        # (especially the frequent ACTIVE query) avoid a full scan
+        self._by_status: Dict[ServiceStatus, set] = defaultdict(set)
         
-        # Ensure services directory exists
-        self.services_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Load existing services
-        self._load_services()
-    
-    def _load_services(self) -> None:
-        """Load services from disk on startup."""
+    async def initialize(self) -> None:
+        """Prepare the services directory and load persisted services.
+
+        Called from ServiceManager.start(); all disk work runs off the
+        event loop so startup never blocks it.
+        """
+        await asyncio.to_thread(self.services_dir.mkdir, parents=True, exist_ok=True)
+        await self._load_services()
+
+    async def _load_services(self) -> None:
+        """Load services from disk concurrently on startup.
+
+        Files are read in parallel so startup latency is bounded by the
+        slowest read rather than the sum over all services.
+        """
         try:
-            # Load service files
-            service_files = list(self.services_dir.glob("*.json"))
-            
-            for service_file in service_files:
-                try:
-                    with open(service_file, 'r', encoding='utf-8') as f:
-                        service_data = json.load(f)
-                    
-                    service_config = ServiceConfig.from_dict(service_data)
-                    self._services[service_config.service_id] = service_config
-                    self._service_index[service_config.name] = service_config.service_id
-                    
-                except Exception as e:
-                    self.logger.error(f"Error loading service from {service_file}: {e}")
-            
-            self.logger.info(f"Loaded {len(self._services)} services from disk")
-            
+            service_files = await asyncio.to_thread(self._scan_service_files)
+            await asyncio.gather(
+                *(self._load_one(service_file) for service_file in service_files)
+            )
+            self.logger.info("Loaded %d services from disk", len(self._services))
+
+        except Exception as e:
+            self.logger.error("Error loading services: %s", e)
+
+    def _scan_service_files(self) -> List[str]:
+        """Enumerate service JSON files.
+
+        os.scandir returns DirEntry objects with cached stat data, so
+        this avoids the per-entry Path construction and pattern matching
+        Path.glob would do on a large services directory.
+        """
+        with os.scandir(self.services_dir) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+
+    async def _load_one(self, service_file: str) -> None:
+        """Load a single service file into the registry."""
+        try:
+            service_data = orjson.loads(
+                await asyncio.to_thread(_read_bytes, service_file)
+            )
+            service_config = ServiceConfig.from_dict(service_data)
+            async with self._lock:
+                self._services[service_config.service_id] = service_config
+                self._service_index[service_config.name] = service_config.service_id
+                self._count_service(service_config, 1)
+
         except Exception as e:
-            self.logger.error(f"Error loading services: {e}")
+            self.logger.error("Error loading service from %s: %s", service_file, e)
     
     async def _save_service(self, service_config: ServiceConfig) -> None:
         """Save service configuration to disk."""
         service_file = self.services_dir / f"{service_config.service_id}.json"
         
         try:
-            service_data = service_config.to_dict()
-            async with aiofiles.open(service_file, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(service_data, indent=2))
-                
+            # orjson encodes the dict far faster than stdlib json, and
+            # write_bytes lands the file in a single syscall instead of
+            # aiofiles' buffered chunked writes
+            data = orjson.dumps(service_config.to_dict(), option=orjson.OPT_INDENT_2)
+            await asyncio.to_thread(service_file.write_bytes, data)
+
         except Exception as e:
-            self.logger.error(f"Error saving service {service_config.service_id}: {e}")
+            self.logger.error("Error saving service %s: %s", service_config.service_id, e)
             raise
     
+    async def start_persistence(self) -> None:
+        """Start the background task that flushes dirty services to disk."""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop_persistence(self) -> None:
+        """Stop the flush task, writing out any still-dirty services."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self._flush_dirty()
+
+    async def _flush_loop(self) -> None:
+        """Periodically persist services marked dirty by status updates."""
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self._flush_dirty()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error("Error flushing dirty services: %s", e)
+
+    async def _flush_dirty(self) -> None:
+        """Write every dirty service to disk once."""
+        async with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        for service_id in dirty:
+            # Re-check and write under the lock: unregister_service
+            # unlinks the file while holding it, so a concurrent delete
+            # cannot interleave with this save and resurrect the JSON.
+            # Taken per service so writers aren't starved by long flushes.
+            async with self._lock:
+                service_config = self._services.get(service_id)
+                if service_config is not None:
+                    await self._save_service(service_config)
+
     async def _delete_service_file(self, service_id: str) -> None:
         """Delete service file from disk."""
         service_file = self.services_dir / f"{service_id}.json"
         
         try:
-            if service_file.exists():
-                service_file.unlink()
-                
+            # Single unlink off the loop; missing_ok replaces the
+            # separate exists() stat
+            await asyncio.to_thread(service_file.unlink, missing_ok=True)
+
         except Exception as e:
-            self.logger.error(f"Error deleting service file {service_id}: {e}")
+            self.logger.error("Error deleting service file %s: %s", service_id, e)
             raise
     
     async def register_service(self, request: ServiceRegistrationRequest) -> ServiceConfig:
         """Register a new service."""
-        with self._lock:
+        async with self._lock:
             # Check for name conflicts
             if request.name in self._service_index:
                 existing_id = self._service_index[request.name]
@@ -99,36 +206,29 @@ class ServiceRegistry:
             # Store in memory
             self._services[service_id] = service_config
             self._service_index[service_config.name] = service_id
+            self._count_service(service_config, 1)
             
             # Save to disk
             await self._save_service(service_config)
             
-            self.logger.info(f"Registered service: {service_id} ({request.name})")
+            self.logger.info("Registered service: %s (%s)", service_id, request.name)
             return service_config
     
     def _generate_routes(self, service_id: str, request: ServiceRegistrationRequest) -> List[str]:
         """Generate routes for a service based on its configuration."""
-        routes = []
-        
         # Base service routes
-        routes.extend([
-            f"/api/v1/services/{service_id}",
-            f"/api/v1/services/{service_id}/health",
-            f"/api/v1/services/{service_id}/tools"
-        ])
-        
-        # Add adapter routes if using SSE hosting
-        if request.hosting_mode.value == "sse":
-            routes.extend([
-                f"/api/v1/mcp/{service_id}",
-                f"/api/v1/stream/{service_id}"
-            ])
-        
+        routes = [t.format(service_id) for t in _BASE_ROUTE_TEMPLATES]
+
+        # Add adapter routes if using SSE hosting (identity check: enum
+        # members are singletons, no .value string comparison needed)
+        if request.hosting_mode is HostingMode.SSE:
+            routes.extend(t.format(service_id) for t in _SSE_ROUTE_TEMPLATES)
+
         return routes
     
     async def unregister_service(self, service_id: str) -> bool:
         """Unregister a service."""
-        with self._lock:
+        async with self._lock:
             if service_id not in self._services:
                 return False
             
@@ -136,86 +236,100 @@ class ServiceRegistry:
             
             # Remove from memory
             del self._services[service_id]
+            self._count_service(service_config, -1)
+            self._dirty.discard(service_id)
             if service_config.name in self._service_index:
                 del self._service_index[service_config.name]
             
             # Delete from disk
             await self._delete_service_file(service_id)
             
-            self.logger.info(f"Unregistered service: {service_id} ({service_config.name})")
+            self.logger.info("Unregistered service: %s (%s)", service_id, service_config.name)
             return True
     
     async def update_service_status(self, service_id: str, status: ServiceStatus) -> bool:
         """Update service status."""
-        with self._lock:
+        async with self._lock:
             if service_id not in self._services:
                 return False
             
             service_config = self._services[service_id]
+            self._status_counts[service_config.status.value] -= 1
+            self._by_status[service_config.status].discard(service_id)
             service_config.update_status(status)
-            
-            # Save to disk
-            await self._save_service(service_config)
-            
-            self.logger.debug(f"Updated service {service_id} status to {status.value}")
+            self._status_counts[status.value] += 1
+            self._by_status[status].add(service_id)
+
+            # Memory-only: the flush task coalesces bursts of status
+            # flips into a single write per service per interval
+            self._dirty.add(service_id)
+            if self._flush_task is None:
+                # No flusher running (e.g. registry used standalone):
+                # fall back to the immediate write
+                await self._save_service(service_config)
+
+            self.logger.debug("Updated service %s status to %s", service_id, status.value)
             return True
     
     def get_service(self, service_id: str) -> Optional[ServiceConfig]:
-        """Get service configuration by ID."""
-        with self._lock:
-            return self._services.get(service_id)
-    
+        """Get service configuration by ID (lock-free read)."""
+        return self._services.get(service_id)
+
     def get_service_by_name(self, name: str) -> Optional[ServiceConfig]:
-        """Get service configuration by name."""
-        with self._lock:
-            service_id = self._service_index.get(name)
-            if service_id:
-                return self._services.get(service_id)
-            return None
-    
+        """Get service configuration by name (lock-free read)."""
+        service_id = self._service_index.get(name)
+        if service_id:
+            return self._services.get(service_id)
+        return None
+
     def list_services(self, status_filter: Optional[ServiceStatus] = None) -> List[ServiceConfig]:
-        """List all services, optionally filtered by status."""
-        with self._lock:
-            services = list(self._services.values())
-            
-            if status_filter:
-                services = [s for s in services if s.status == status_filter]
-            
-            return services
+        """List all services, optionally filtered by status (lock-free)."""
+        if status_filter:
+            # O(matching) via the status index instead of a full scan
+            ids = self._by_status.get(status_filter, ())
+            return [self._services[sid] for sid in ids if sid in self._services]
+
+        return list(self._services.values())
     
+    def iter_services(self, status_filter: Optional[ServiceStatus] = None) -> Iterator[ServiceConfig]:
+        """Iterate services without materializing a config list.
+
+        For iterate-once callers this avoids the O(N) list copy that
+        list_services makes. The filtered form snapshots the ID set up
+        front, so callers may change a service's status mid-iteration
+        (services removed meanwhile are skipped).
+        """
+        if status_filter:
+            ids = tuple(self._by_status.get(status_filter, ()))
+            return (self._services[sid] for sid in ids if sid in self._services)
+        return iter(self._services.values())
+
     def get_active_services(self) -> List[ServiceConfig]:
         """Get all active services."""
         return self.list_services(ServiceStatus.ACTIVE)
     
     def get_service_stats(self) -> Dict[str, Any]:
-        """Get service registry statistics."""
-        with self._lock:
-            total_services = len(self._services)
-            active_services = len([s for s in self._services.values() if s.status == ServiceStatus.ACTIVE])
-            inactive_services = len([s for s in self._services.values() if s.status == ServiceStatus.INACTIVE])
-            error_services = len([s for s in self._services.values() if s.status == ServiceStatus.ERROR])
-            
-            return {
-                "total_services": total_services,
-                "active_services": active_services,
-                "inactive_services": inactive_services,
-                "error_services": error_services,
-                "services_by_type": self._get_services_by_type(),
-                "services_by_hosting_mode": self._get_services_by_hosting_mode()
-            }
-    
-    def _get_services_by_type(self) -> Dict[str, int]:
-        """Get service count by type."""
-        type_counts = {}
-        for service in self._services.values():
-            service_type = service.service_type.value
-            type_counts[service_type] = type_counts.get(service_type, 0) + 1
-        return type_counts
-    
-    def _get_services_by_hosting_mode(self) -> Dict[str, int]:
-        """Get service count by hosting mode."""
-        mode_counts = {}
-        for service in self._services.values():
-            hosting_mode = service.hosting_mode.value
-            mode_counts[hosting_mode] = mode_counts.get(hosting_mode, 0) + 1
-        return mode_counts
+        """Get service registry statistics (O(1) from incremental counters)."""
+        return {
+            "total_services": len(self._services),
+            "active_services": self._status_counts[ServiceStatus.ACTIVE.value],
+            "inactive_services": self._status_counts[ServiceStatus.INACTIVE.value],
+            "error_services": self._status_counts[ServiceStatus.ERROR.value],
+            "services_by_type": dict(self._type_counts),
+            "services_by_hosting_mode": dict(self._mode_counts)
+        }
+
+    def _count_service(self, service_config: ServiceConfig, delta: int) -> None:
+        """Adjust the stats counters for one service (call under the lock)."""
+        self._status_counts[service_config.status.value] += delta
+        self._type_counts[service_config.service_type.value] += delta
+        self._mode_counts[service_config.hosting_mode.value] += delta
+        if delta > 0:
+            self._by_status[service_config.status].add(service_config.service_id)
+        else:
+            self._by_status[service_config.status].discard(service_config.service_id)
+        if delta < 0:
+            # Drop zeroed keys so the stats dicts only list present values
+            for counts in (self._type_counts, self._mode_counts):
+                for key in [k for k, v in counts.items() if v <= 0]:
+                    del counts[key]
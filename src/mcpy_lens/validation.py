@@ -6,9 +6,53 @@ if they're suitable for different hosting modes.
 """
 
 import ast
+import functools
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> ast.Module | None:
+    """
+    Parse a script file, memoized on (path, mtime, size).
+
+    Scripts are re-validated repeatedly during wrapper generation and
+    re-uploads; keying the cache on the stat data means an unchanged
+    file costs one stat plus a dict lookup instead of a read and a full
+    ast.parse. Returns None for scripts that fail to parse (also cached,
+    so broken scripts don't get re-parsed either).
+    """
+    with open(path_str, encoding='utf-8') as f:
+        script_content = f.read()
+    try:
+        return ast.parse(script_content)
+    except SyntaxError:
+        return None
+
+
+def _parse_script(script_path: Path) -> ast.Module | None:
+    """Stat the script once and return its (cached) parsed AST."""
+    try:
+        st = script_path.stat()
+    except OSError:
+        raise FileNotFoundError(f"Script file not found: {script_path}")
+    return _parse_cached(str(script_path), st.st_mtime_ns, st.st_size)
+
+
+def _find_main_block(tree: ast.Module) -> ast.If | None:
+    """Find the if __name__ == "__main__" block at module level, if any."""
+    for node in tree.body:
+        if isinstance(node, ast.If):
+            test = node.test
+            if (isinstance(test, ast.Compare) and
+                isinstance(test.left, ast.Name) and test.left.id == "__name__" and
+                len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq) and
+                len(test.comparators) == 1 and
+                isinstance(test.comparators[0], ast.Constant) and
+                test.comparators[0].value == "__main__"):
+                return node
+    return None
+
+
 def validate_script_entry_point(script_path: Path) -> bool:
     """
     Validate if a Python script has an if __name__ == "__main__" block.
@@ -19,28 +63,10 @@ def validate_script_entry_point(script_path: Path) -> bool:
     Returns:
         True if the script has an entry point, False otherwise
     """
-    if not script_path.exists():
-        raise FileNotFoundError(f"Script file not found: {script_path}")
-
-    with open(script_path, encoding='utf-8') as f:
-        script_content = f.read()    # Parse the Python code to AST
-    try:
-        tree = ast.parse(script_content)
-        for node in tree.body:
-            # Look for if statements at the module level
-            if isinstance(node, ast.If):
-                # Check if it's an if __name__ == "__main__" block
-                test = node.test
-                if (isinstance(test, ast.Compare) and
-                    isinstance(test.left, ast.Name) and test.left.id == "__name__" and
-                    len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq) and
-                    len(test.comparators) == 1 and
-                    isinstance(test.comparators[0], ast.Constant) and
-                    test.comparators[0].value == "__main__"):
-                    return True
-        return False
-    except SyntaxError:
+    tree = _parse_script(script_path)
+    if tree is None:
         return False
+    return _find_main_block(tree) is not None
 
 
 def extract_main_block_arguments(script_path: Path) -> list[tuple[str, str, object | None]]:
@@ -56,125 +82,130 @@ def extract_main_block_arguments(script_path: Path) -> list[tuple[str, str, obje
     Returns:
         List of tuples (arg_name, arg_type, default_value) for identified arguments
     """
-    if not validate_script_entry_point(script_path):
+    # Shares the parse cache with validate_script_entry_point instead of
+    # re-reading and re-parsing the same file
+    tree = _parse_script(script_path)
+    if tree is None:
         return []
 
-    with open(script_path, encoding='utf-8') as f:
-        script_content = f.read()
-
     arguments = []
     argparse_imports = set()
 
-    # Parse the Python code to AST
-    try:
-        tree = ast.parse(script_content)
-
-        # Check for relevant imports first
-        for node in tree.body:
-            if isinstance(node, ast.Import):
+    # Check for relevant imports first
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for name in node.names:
+                if name.name == 'argparse':
+                    argparse_imports.add(name.name)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module == 'argparse':
                 for name in node.names:
-                    if name.name == 'argparse':
-                        argparse_imports.add(name.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module == 'argparse':
-                    for name in node.names:
-                        argparse_imports.add(f"argparse.{name.name}")
-
-        # Find the main block
-        main_block = None
-        for node in tree.body:
-            if isinstance(node, ast.If):
-                test = node.test
-                if (isinstance(test, ast.Compare) and
-                    isinstance(test.left, ast.Name) and test.left.id == "__name__" and
-                    len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq) and
-                    len(test.comparators) == 1 and
-                    isinstance(test.comparators[0], ast.Constant) and
-                    test.comparators[0].value == "__main__"):
-                    main_block = node
-                    break
-
-        if not main_block:
-            return []
-
-        # Look for argparse usage in the main block
-        if argparse_imports:
-            arguments.extend(_extract_argparse_arguments(main_block))
-
-        # Look for sys.argv usage as fallback
-        if not arguments:
-            arguments.extend(_extract_sys_argv_usage(main_block))
-
-        return arguments
+                    argparse_imports.add(f"argparse.{name.name}")
 
-    except SyntaxError:
+    # Find the main block
+    main_block = _find_main_block(tree)
+    if not main_block:
         return []
 
+    # One traversal collects everything the extraction below consumes
+    analyzer = _MainAnalyzer()
+    analyzer.visit(main_block)
+
+    # Look for argparse usage in the main block
+    if argparse_imports:
+        arguments.extend(
+            argument
+            for call in analyzer.add_argument_calls
+            if call.func.value.id in analyzer.parser_vars
+            and (argument := _argument_from_call(call)) is not None
+        )
+
+    # Look for sys.argv usage as fallback
+    if not arguments:
+        arguments.extend(
+            (f"arg{index}", "string", None)
+            for index in sorted(analyzer.sys_argv_indices)
+        )
 
-def _extract_argparse_arguments(main_block: ast.If) -> list[tuple[str, str, object | None]]:
-    """
-    Extract arguments defined with argparse in the main block.
+    return arguments
 
-    Args:
-        main_block: AST node for the if __name__ == "__main__" block
 
-    Returns:
-        List of (arg_name, arg_type, default_value) tuples
+class _MainAnalyzer(ast.NodeVisitor):
     """
-    arguments = []
-    parser_var = None
+    Collect argparse and sys.argv usage from a main block in one pass.
 
-    # Find the parser definition (argparse.ArgumentParser())
-    for node in ast.walk(main_block):
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and isinstance(node.value, ast.Call):
-                    call = node.value
-                    if _is_argparse_constructor(call):
-                        parser_var = target.id
-                        break
+    Replaces three full ast.walk traversals (parser assignments,
+    add_argument calls, sys.argv subscripts) with a single visit over
+    the block; each walk is O(nodes) with Python-level iteration, so
+    this cuts the dominant cost of argument extraction to one pass.
+    """
 
-    if not parser_var:
-        return []
+    def __init__(self) -> None:
+        self.parser_vars: set[str] = set()
+        self.add_argument_calls: list[ast.Call] = []
+        self.sys_argv_indices: set[int] = set()
 
-    # Find add_argument calls on the parser
-    for node in ast.walk(main_block):
-        if (isinstance(node, ast.Call) and
-            isinstance(node.func, ast.Attribute) and
+    def visit_Assign(self, node: ast.Assign) -> None:
+        # Parser definition: <name> = argparse.ArgumentParser(...)
+        if isinstance(node.value, ast.Call) and _is_argparse_constructor(node.value):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self.parser_vars.add(target.id)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        # Record every <name>.add_argument(...) call; calls on variables
+        # that turn out not to be parsers are filtered by the consumer
+        if (isinstance(node.func, ast.Attribute) and
             node.func.attr == "add_argument" and
-            isinstance(node.func.value, ast.Name) and
-            node.func.value.id == parser_var):
-
-            arg_name = None
-            arg_type = "string"  # Default type
-            default_value = None
-
-            # Get the argument name
-            for arg in node.args:
-                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                    if arg.value.startswith('--'):
-                        arg_name = arg.value[2:]
-                        break
-
-            # Check keywords for type and default
-            for kw in node.keywords:
-                if kw.arg == "type":
-                    if isinstance(kw.value, ast.Name):
-                        if kw.value.id == "int":
-                            arg_type = "integer"
-                        elif kw.value.id == "float":
-                            arg_type = "number"
-                        elif kw.value.id == "bool":
-                            arg_type = "boolean"
-                elif kw.arg == "default" and isinstance(kw.value, ast.Constant):
-                    default_value = kw.value.value
-                elif kw.arg == "dest" and isinstance(kw.value, ast.Constant):
-                    arg_name = kw.value.value
-
-            if arg_name:
-                arguments.append((arg_name, arg_type, default_value))
+            isinstance(node.func.value, ast.Name)):
+            self.add_argument_calls.append(node)
+        self.generic_visit(node)
 
-    return arguments
+    def visit_Subscript(self, node: ast.Subscript) -> None:
+        # Simple positional access like sys.argv[1]
+        if (isinstance(node.value, ast.Attribute) and
+            node.value.attr == "argv" and
+            isinstance(node.value.value, ast.Name) and
+            node.value.value.id == "sys"):
+            index = node.slice
+            if isinstance(index, ast.Constant) and isinstance(index.value, int):
+                if index.value > 0:
+                    self.sys_argv_indices.add(index.value)
+        self.generic_visit(node)
+
+
+def _argument_from_call(node: ast.Call) -> tuple[str, str, object | None] | None:
+    """Turn one add_argument call into an (arg_name, arg_type, default) tuple."""
+    arg_name = None
+    arg_type = "string"  # Default type
+    default_value = None
+
+    # Get the argument name
+    for arg in node.args:
+        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+            if arg.value.startswith('--'):
+                arg_name = arg.value[2:]
+                break
+
+    # Check keywords for type and default
+    for kw in node.keywords:
+        if kw.arg == "type":
+            if isinstance(kw.value, ast.Name):
+                if kw.value.id == "int":
+                    arg_type = "integer"
+                elif kw.value.id == "float":
+                    arg_type = "number"
+                elif kw.value.id == "bool":
+                    arg_type = "boolean"
+        elif kw.arg == "default" and isinstance(kw.value, ast.Constant):
+            default_value = kw.value.value
+        elif kw.arg == "dest" and isinstance(kw.value, ast.Constant):
+            arg_name = kw.value.value
+
+    if arg_name:
+        return (arg_name, arg_type, default_value)
+    return None
 
 
 def _is_argparse_constructor(call_node: ast.Call) -> bool:
@@ -186,42 +217,3 @@ def _is_argparse_constructor(call_node: ast.Call) -> bool:
     elif isinstance(call_node.func, ast.Name):
         return call_node.func.id == "ArgumentParser"
     return False
-
-
-def _extract_sys_argv_usage(main_block: ast.If) -> list[tuple[str, str, object | None]]:
-    """
-    Look for sys.argv usage patterns in the main block.
-    This is a fallback when argparse is not used.
-
-    Args:
-        main_block: AST node for the if __name__ == "__main__" block
-
-    Returns:
-        List of (arg_name, arg_type, default_value) tuples
-    """
-    # This is a simplified implementation that looks for common patterns
-    # A real implementation would need more sophisticated analysis
-    arguments = []
-    sys_argv_uses = set()
-
-    # Find sys.argv accesses
-    for node in ast.walk(main_block):
-        if (isinstance(node, ast.Subscript) and
-            isinstance(node.value, ast.Attribute) and
-            node.value.attr == "argv" and
-            isinstance(node.value.value, ast.Name) and
-            node.value.value.id == "sys"):
-
-            # Check if it's a simple index like sys.argv[1]
-            if isinstance(node.slice, ast.Index) and isinstance(node.slice.value, ast.Constant):
-                index = node.slice.value.value
-                if isinstance(index, int) and index > 0:
-                    sys_argv_uses.add(index)
-
-    # For each index used, create a generic argument entry
-    for index in sorted(sys_argv_uses):
-        arg_name = f"arg{index}"
-        arg_type = "string"  # Default to string
-        arguments.append((arg_name, arg_type, None))
-
-    return arguments
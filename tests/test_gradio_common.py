@@ -0,0 +1,119 @@
+"""
+Unit tests for the gradio_app common helpers.
+
+Covers the debounce/throttle rate-limit decorators and the one-slot
+validate_json_input parse cache.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mcpy_lens.gradio_app.components.common import (
+    debounce, throttle, validate_json_input
+)
+
+
+class TestDebounce:
+    """Trailing-call semantics of the debounce decorator."""
+
+    async def test_single_call_runs_after_delay(self):
+        calls = []
+
+        @debounce(0.01)
+        async def handler(value):
+            calls.append(value)
+            return value
+
+        assert await handler("a") == "a"
+        assert calls == ["a"]
+
+    async def test_burst_runs_only_the_last_call(self):
+        calls = []
+
+        @debounce(0.05)
+        async def handler(value):
+            calls.append(value)
+            return value
+
+        results = await asyncio.gather(
+            handler("a"), handler("b"), handler("c")
+        )
+
+        # Only the trailing invocation executes the handler
+        assert calls == ["c"]
+        assert results[2] == "c"
+
+    async def test_superseded_calls_skip_output_updates(self):
+        import gradio as gr
+
+        @debounce(0.05)
+        async def handler(value):
+            return value
+
+        results = await asyncio.gather(handler("a"), handler("b"))
+
+        # The stale invocation must not overwrite outputs
+        assert type(results[0]) is type(gr.skip())
+        assert results[1] == "b"
+
+
+class TestThrottle:
+    """Window semantics of the throttle decorator."""
+
+    async def test_calls_inside_window_return_cached_result(self):
+        calls = []
+
+        @throttle(60.0)
+        async def handler():
+            calls.append(1)
+            return {"count": len(calls)}
+
+        first = await handler()
+        second = await handler()
+
+        assert len(calls) == 1
+        assert second is first
+
+    async def test_call_after_window_runs_again(self):
+        calls = []
+
+        @throttle(0.01)
+        async def handler():
+            calls.append(1)
+            return len(calls)
+
+        assert await handler() == 1
+        await asyncio.sleep(0.02)
+        assert await handler() == 2
+
+
+class TestValidateJsonInputCache:
+    """One-slot parse cache keyed on the exact input string."""
+
+    def test_valid_json_parses(self):
+        is_valid, data, error = validate_json_input('{"key": "value"}')
+        assert is_valid
+        assert data == {"key": "value"}
+        assert error is None
+
+    def test_invalid_json_reports_error(self):
+        is_valid, data, error = validate_json_input("{not json}")
+        assert not is_valid
+        assert data is None
+        assert error
+
+    def test_repeat_input_returns_cached_object(self):
+        payload = '{"a": [1, 2, 3]}'
+        _, first, _ = validate_json_input(payload)
+        _, second, _ = validate_json_input(payload)
+        assert second is first
+
+    def test_different_input_is_not_served_from_cache(self):
+        _, first, _ = validate_json_input('{"a": 1}')
+        _, second, _ = validate_json_input('{"a": 2}')
+        assert second == {"a": 2}
+        assert second is not first
@@ -0,0 +1,99 @@
+"""
+Unit tests for the _RouteTrie used by RouteManager conflict detection.
+
+The trie replaces flat exact-match lookups with segment-wise matching,
+so these tests pin its overlap semantics (exact, ancestor, descendant)
+and the branch pruning done by remove().
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mcpy_lens.routing import _RouteTrie
+
+
+class TestRouteTrieConflicts:
+    """Conflict detection semantics."""
+
+    def test_empty_trie_has_no_conflicts(self):
+        trie = _RouteTrie()
+        assert trie.find_conflict("/svc/invoke") is None
+
+    def test_exact_duplicate_is_a_conflict(self):
+        trie = _RouteTrie()
+        trie.insert("/svc/invoke", "svc-1")
+        assert trie.find_conflict("/svc/invoke") == "svc-1"
+
+    def test_registered_ancestor_is_a_conflict(self):
+        trie = _RouteTrie()
+        trie.insert("/svc", "svc-1")
+        assert trie.find_conflict("/svc/invoke") == "svc-1"
+
+    def test_registered_descendant_is_a_conflict(self):
+        trie = _RouteTrie()
+        trie.insert("/svc/invoke/deep", "svc-1")
+        assert trie.find_conflict("/svc/invoke") == "svc-1"
+
+    def test_disjoint_paths_do_not_conflict(self):
+        trie = _RouteTrie()
+        trie.insert("/svc-a/invoke", "svc-a")
+        assert trie.find_conflict("/svc-b/invoke") is None
+
+    def test_sibling_segments_do_not_conflict(self):
+        trie = _RouteTrie()
+        trie.insert("/svc/invoke", "svc-1")
+        assert trie.find_conflict("/svc/healthz") is None
+
+    def test_trailing_slash_normalizes_to_same_path(self):
+        trie = _RouteTrie()
+        trie.insert("/svc/invoke/", "svc-1")
+        assert trie.find_conflict("/svc/invoke") == "svc-1"
+
+
+class TestRouteTrieRemove:
+    """remove() correctness, including branch pruning."""
+
+    def test_remove_clears_the_conflict(self):
+        trie = _RouteTrie()
+        trie.insert("/svc/invoke", "svc-1")
+        trie.remove("/svc/invoke")
+        assert trie.find_conflict("/svc/invoke") is None
+
+    def test_remove_prunes_empty_branches(self):
+        trie = _RouteTrie()
+        trie.insert("/svc/invoke/deep", "svc-1")
+        trie.remove("/svc/invoke/deep")
+        # The whole now-empty chain must be gone, not just the leaf flag
+        assert trie.children == {}
+
+    def test_remove_keeps_branches_with_other_owners(self):
+        trie = _RouteTrie()
+        trie.insert("/svc/invoke", "svc-1")
+        trie.insert("/svc/healthz", "svc-1")
+        trie.remove("/svc/invoke")
+        assert trie.find_conflict("/svc/healthz") == "svc-1"
+        assert trie.find_conflict("/svc/invoke") is None
+
+    def test_remove_keeps_registered_ancestor_on_the_path(self):
+        trie = _RouteTrie()
+        trie.insert("/svc", "svc-1")
+        trie.insert("/svc/invoke", "svc-2")
+        trie.remove("/svc/invoke")
+        # Pruning must stop at the still-registered ancestor
+        assert trie.find_conflict("/svc/anything") == "svc-1"
+
+    def test_remove_missing_path_is_a_noop(self):
+        trie = _RouteTrie()
+        trie.insert("/svc/invoke", "svc-1")
+        trie.remove("/other/path")
+        assert trie.find_conflict("/svc/invoke") == "svc-1"
+
+    def test_reinsert_after_remove(self):
+        trie = _RouteTrie()
+        trie.insert("/svc/invoke", "svc-1")
+        trie.remove("/svc/invoke")
+        trie.insert("/svc/invoke", "svc-2")
+        assert trie.find_conflict("/svc/invoke") == "svc-2"
@@ -0,0 +1,99 @@
+"""
+Unit tests for the ServiceRegistry dirty-set persistence flusher.
+
+Status updates are memory-only while the flush task runs; these tests
+pin the coalescing behavior, the flush on stop, and the immediate-write
+fallback when no flusher is active.
+"""
+
+import sys
+from pathlib import Path
+
+import orjson
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mcpy_lens.service_registry.models import (
+    HostingMode, ServiceRegistrationRequest, ServiceStatus, ServiceType
+)
+from mcpy_lens.service_registry.service_registry import ServiceRegistry
+
+
+def _make_request(name: str = "test-service") -> ServiceRegistrationRequest:
+    return ServiceRegistrationRequest(
+        name=name,
+        description="A test service",
+        service_type=ServiceType.FUNCTION,
+        hosting_mode=HostingMode.STDIO,
+        script_id="script-1",
+        tools=[],
+    )
+
+
+def _stored_status(services_dir: Path, service_id: str) -> str:
+    data = orjson.loads((services_dir / f"{service_id}.json").read_bytes())
+    return data["status"]
+
+
+async def test_status_update_without_flusher_writes_immediately(tmp_path):
+    registry = ServiceRegistry(tmp_path)
+    await registry.initialize()
+    config = await registry.register_service(_make_request())
+
+    await registry.update_service_status(config.service_id, ServiceStatus.ACTIVE)
+
+    assert _stored_status(tmp_path, config.service_id) == "active"
+
+
+async def test_status_update_with_flusher_is_memory_only_until_flush(tmp_path):
+    registry = ServiceRegistry(tmp_path)
+    await registry.initialize()
+    config = await registry.register_service(_make_request())
+    await registry.start_persistence()
+    try:
+        await registry.update_service_status(config.service_id, ServiceStatus.ACTIVE)
+
+        # Memory sees the new status, disk still holds the old one
+        assert registry.get_service(config.service_id).status == ServiceStatus.ACTIVE
+        assert _stored_status(tmp_path, config.service_id) == "inactive"
+        assert config.service_id in registry._dirty
+    finally:
+        await registry.stop_persistence()
+
+    # stop_persistence flushes whatever is still dirty
+    assert _stored_status(tmp_path, config.service_id) == "active"
+    assert registry._dirty == set()
+
+
+async def test_burst_of_status_flips_coalesces_to_final_state(tmp_path):
+    registry = ServiceRegistry(tmp_path)
+    await registry.initialize()
+    config = await registry.register_service(_make_request())
+    await registry.start_persistence()
+    try:
+        for status in (ServiceStatus.ACTIVE, ServiceStatus.ERROR,
+                       ServiceStatus.INACTIVE, ServiceStatus.ACTIVE):
+            await registry.update_service_status(config.service_id, status)
+
+        # A storm of flips leaves one dirty entry, not one write per flip
+        assert registry._dirty == {config.service_id}
+    finally:
+        await registry.stop_persistence()
+
+    assert _stored_status(tmp_path, config.service_id) == "active"
+
+
+async def test_unregister_drops_pending_dirty_entry(tmp_path):
+    registry = ServiceRegistry(tmp_path)
+    await registry.initialize()
+    config = await registry.register_service(_make_request())
+    await registry.start_persistence()
+    try:
+        await registry.update_service_status(config.service_id, ServiceStatus.ACTIVE)
+        assert await registry.unregister_service(config.service_id)
+    finally:
+        await registry.stop_persistence()
+
+    # The flush must not resurrect the deleted service file
+    assert not (tmp_path / f"{config.service_id}.json").exists()
@@ -0,0 +1,66 @@
+"""
+Response-shape tests for service registry routes.
+
+The route layer builds responses with model_construct, which skips
+validation, so these tests pin the payload shape against the declared
+response models to catch key drift (e.g. the persisted "type" key vs
+the schema's "service_type" field) that would otherwise ship silently.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mcpy_lens.service_registry.models import (
+    HostingMode, ServiceConfig, ServiceType, ToolInfo
+)
+from mcpy_lens.service_registry.routes import (
+    ServiceConfigResponse, _service_payload, _service_to_response
+)
+
+
+def _make_config() -> ServiceConfig:
+    return ServiceConfig(
+        service_id="svc-1",
+        name="Test Service",
+        description="A test service",
+        service_type=ServiceType.FUNCTION,
+        hosting_mode=HostingMode.SSE,
+        script_id="script-1",
+        tools=[ToolInfo("echo", "Echo a value", {"value": "string"}, "string")],
+        routes=["/api/v1/services/svc-1"],
+    )
+
+
+def test_service_payload_matches_response_schema():
+    """The raw dict payload must carry exactly the declared fields."""
+    payload = _service_payload(_make_config())
+
+    assert set(payload) == set(ServiceConfigResponse.model_fields)
+    assert payload["service_type"] == "function"
+    assert "type" not in payload
+    assert payload["tool_count"] == 1
+
+
+def test_service_payload_does_not_mutate_cached_dict():
+    """to_dict() is memoized; building a payload must not corrupt it."""
+    config = _make_config()
+    _service_payload(config)
+
+    cached = config.to_dict()
+    assert "type" in cached
+    assert "tool_count" not in cached
+
+
+def test_service_to_response_sets_every_field():
+    """model_construct must populate every declared response field."""
+    response = _service_to_response(_make_config())
+    dumped = response.model_dump()
+
+    assert set(dumped) == set(ServiceConfigResponse.model_fields)
+    assert dumped["service_type"] == "function"
+    assert dumped["tools"][0]["name"] == "echo"
+    # The constructed shape must round-trip through real validation
+    ServiceConfigResponse.model_validate(dumped)